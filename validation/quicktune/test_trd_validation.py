@@ -0,0 +1,48 @@
+"""
+Regression tests for the QuickTune TRD validation simulation.
+
+Run from this directory with: python -m unittest test_trd_validation
+"""
+
+import unittest
+
+import numpy as np
+
+from trd_validation import (MAX_ITERATIONS, TRD_AUTO_EQ_TOLERANCE, create_10_room_test_suite,
+                            quicktune_compute_correction, quicktune_iterative)
+
+
+class QuickTuneIterativeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.room = create_10_room_test_suite()[0]
+
+    def test_zero_iterations_measures_initial_correction(self):
+        result = quicktune_iterative(self.room, max_iterations=0)
+
+        self.assertEqual(result['error_history'], [])
+        self.assertEqual(result['measured_iterations'], [])
+        np.testing.assert_array_equal(result['final_gains'],
+                                      quicktune_compute_correction(result['measured_levels']))
+        self.assertTrue(np.isfinite(result['max_error']))
+
+    def test_every_pass_is_measured(self):
+        result = quicktune_iterative(self.room)
+
+        self.assertEqual(result['measured_iterations'], list(range(MAX_ITERATIONS)))
+
+    def test_early_exit_stops_on_measured_pass_within_tolerance(self):
+        result = quicktune_iterative(self.room, early_exit=True)
+
+        self.assertLessEqual(result['error_history'][-1], TRD_AUTO_EQ_TOLERANCE)
+        self.assertTrue(all(error > TRD_AUTO_EQ_TOLERANCE for error in result['error_history'][:-1]))
+
+    def test_predict_mode_ends_on_measured_pass(self):
+        result = quicktune_iterative(self.room, predict=True)
+
+        self.assertEqual(result['measured_iterations'][0], 0)
+        self.assertEqual(result['measured_iterations'][-1], len(result['error_history']) - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,9 +25,10 @@ Date: 2026-02-10 (Updated with corrected test logic)
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 from scipy import signal
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+import argparse
 import os
 from datetime import datetime
 
@@ -50,12 +51,18 @@ MAX_ITERATIONS = 3
 DAMPING_FACTOR = 0.7
 TONE_AMPLITUDE = 0.5
 FADE_SAMPLES = 480  # 10 ms
+VALIDATION_SEED = 0  # Root seed for the per-room noise streams
 
 # Sample counts
 TONE_SETTLING_SAMPLES = int(FS * TONE_SETTLING_MS / 1000)
 TONE_ANALYSIS_SAMPLES = int(FS * TONE_ANALYSIS_MS / 1000)
 TONE_TOTAL_SAMPLES = int(FS * TONE_TOTAL_MS / 1000)
 
+# Fade in/out envelope shared by every tone (linear 10 ms ramps)
+TONE_ENVELOPE = np.ones(TONE_TOTAL_SAMPLES, dtype=np.float32)
+TONE_ENVELOPE[:FADE_SAMPLES] = np.arange(FADE_SAMPLES) / FADE_SAMPLES
+TONE_ENVELOPE[-FADE_SAMPLES:] = np.arange(FADE_SAMPLES, 0, -1) / FADE_SAMPLES
+
 # TRD Thresholds
 TRD_MEMS_CAL_TOLERANCE = 1.0  # ±1 dB
 TRD_AUTO_EQ_TOLERANCE = 1.0   # ±1 dB
@@ -65,6 +72,9 @@ TRD_CAL_TIME_MAX = 10.0       # < 10 seconds
 TRD_STABLE_VAR_MAX = 0.5      # < 0.5 dB variation
 TRD_MEMORY_BUDGET = 1024      # < 1 KB
 
+# Vectorized vs bit-exact measurement agreement (not a TRD requirement)
+BIT_EXACT_FAST_TOLERANCE = 0.01  # dB
+
 # ============================================================================
 # RECURSIVE TONE GENERATOR (bit-accurate to embedded)
 # ============================================================================
@@ -87,22 +97,62 @@ class RecursiveToneGenerator:
         self.y2 = self.y1
         self.y1 = y0
 
-        # Apply fade in/out
-        amplitude = self.amplitude
-        if sample_index < FADE_SAMPLES:
-            amplitude *= sample_index / FADE_SAMPLES
-        elif sample_index >= TONE_TOTAL_SAMPLES - FADE_SAMPLES:
-            fade_index = TONE_TOTAL_SAMPLES - sample_index
-            amplitude *= fade_index / FADE_SAMPLES
-
-        return y0 * amplitude
+        # Apply fade in/out (precomputed envelope, no per-sample branches)
+        return y0 * (self.amplitude * TONE_ENVELOPE[sample_index])
 
     def generate_tone(self) -> np.ndarray:
-        """Generate complete tone."""
-        tone = np.zeros(TONE_TOTAL_SAMPLES, dtype=np.float32)
-        for i in range(TONE_TOTAL_SAMPLES):
-            tone[i] = self.generate_sample(i)
-        return tone
+        """Generate complete tone.
+
+        Closed form of the recursion (y[n] = sin(w*n), w = acos(coeff/2))
+        with the fade envelope applied in one pass; generate_sample() is kept
+        as the sample-by-sample reference.
+        """
+        w = np.arccos(np.float64(self.coeff) / 2.0)
+        tone = self.amplitude * np.sin(w * np.arange(TONE_TOTAL_SAMPLES)) * TONE_ENVELOPE
+        return tone.astype(np.float32)
+
+    def generate_tone_exact(self) -> np.ndarray:
+        """Generate complete tone, bit-identical to calling generate_sample().
+
+        Runs the recursion itself, in the oscillator's own precision, as the
+        zero-input all-pole IIR 1/[1, -coeff, 1] seeded with the oscillator
+        state, then applies the same fade envelope.
+        """
+        dtype = np.result_type(self.coeff, self.y1, self.y2)
+        coeff = dtype.type(self.coeff)
+        zi = np.array([coeff * self.y1 - self.y2, -self.y1], dtype=dtype)
+        y, _ = signal.lfilter(np.zeros(1, dtype=dtype), np.array([1.0, -coeff, 1.0], dtype=dtype),
+                              np.zeros(TONE_TOTAL_SAMPLES, dtype=dtype), zi=zi)
+        return (y * (self.amplitude * TONE_ENVELOPE.astype(dtype))).astype(np.float32)
+
+# Tones depend only on band frequency, so each is generated once and shared
+_TONE_CACHE: Dict[Tuple[float, bool], np.ndarray] = {}
+
+def get_tone(frequency: float, bit_exact: bool = False) -> np.ndarray:
+    """Return the (read-only) test tone for a band, generating it on first use.
+
+    bit_exact selects the sample-exact oscillator output instead of the
+    closed-form tone.
+    """
+    key = (float(frequency), bit_exact)
+    tone = _TONE_CACHE.get(key)
+    if tone is None:
+        tone_gen = RecursiveToneGenerator(frequency)
+        tone = tone_gen.generate_tone_exact() if bit_exact else tone_gen.generate_tone()
+        tone.flags.writeable = False
+        _TONE_CACHE[key] = tone
+    return tone
+
+_TONE_BANKS: Dict[bool, np.ndarray] = {}
+
+def get_tone_bank(bit_exact: bool = False) -> np.ndarray:
+    """Return every band's test tone stacked as a (bands, samples) array (cached, read-only)."""
+    bank = _TONE_BANKS.get(bit_exact)
+    if bank is None:
+        bank = np.stack([get_tone(freq, bit_exact) for freq in BAND_FREQS])
+        bank.flags.writeable = False
+        _TONE_BANKS[bit_exact] = bank
+    return bank
 
 # ============================================================================
 # GOERTZEL ALGORITHM (bit-accurate to embedded)
@@ -120,12 +170,29 @@ class GoertzelFilter:
         self.s2 = 0.0
         self.num_samples = num_samples
 
+        # The recursion as a single second-order section: 1 / [1, -coeff, 1]
+        self.sos = np.array([[1.0, 0.0, 0.0, 1.0, -self.coeff, 1.0]])
+
     def process_sample(self, sample: float):
         """Process one sample."""
         s0 = self.coeff * self.s1 - self.s2 + sample
         self.s2 = self.s1
         self.s1 = s0
 
+    def process_block(self, samples: np.ndarray):
+        """Process a block of samples.
+
+        Same recursion as process_sample(), run through sosfilt as the
+        single section self.sos, starting from the current state.
+        """
+        if len(samples) == 0:
+            return
+
+        zi = [[self.coeff * self.s1 - self.s2, -self.s1]]
+        states, _ = signal.sosfilt(self.sos, samples, zi=zi)
+        self.s2 = states[-2] if len(states) > 1 else self.s1
+        self.s1 = states[-1]
+
     def get_power_db(self) -> float:
         """Compute final power in dB."""
         power = self.s1**2 + self.s2**2 - self.coeff * self.s1 * self.s2
@@ -136,6 +203,43 @@ class GoertzelFilter:
         else:
             return -120.0
 
+# Each band's Goertzel result is one DFT bin of its analysis window, so all
+# ten bands can be evaluated against a precomputed (bands, samples) basis
+GOERTZEL_BINS = np.array([int(0.5 + TONE_ANALYSIS_SAMPLES * f / FS) for f in BAND_FREQS])
+GOERTZEL_BASIS = np.exp(-2j * np.pi * np.outer(GOERTZEL_BINS, np.arange(TONE_ANALYSIS_SAMPLES))
+                        / TONE_ANALYSIS_SAMPLES)
+
+def goertzel_levels_db(analysis_windows: np.ndarray) -> np.ndarray:
+    """Goertzel level (dB re unit sine) of every band's analysis window at once.
+
+    Row b of analysis_windows (shape (..., bands, samples)) is measured at
+    BAND_FREQS[b]; equivalent to running GoertzelFilter over each row and
+    calling get_power_db().
+    """
+    spectrum = np.einsum('...bn,bn->...b', analysis_windows, GOERTZEL_BASIS)
+
+    # magnitude^2 = 2 * power / N^2, converted with 10*log10 (no sqrt); the
+    # clamp keeps log10 finite so the -120 dB floor is a branchless select
+    magnitude_sq = (spectrum.real**2 + spectrum.imag**2) * (2.0 / TONE_ANALYSIS_SAMPLES**2)
+    return np.where(magnitude_sq > 1e-18, 10.0 * np.log10(np.maximum(magnitude_sq, 1e-18)), -120.0)
+
+def measure_band_levels(analysis_windows: np.ndarray, bit_exact: bool = False) -> np.ndarray:
+    """Goertzel level (dB) of every band's analysis window.
+
+    The default path is the batched goertzel_levels_db(); bit_exact runs each
+    band through GoertzelFilter, whose recursion matches the embedded one
+    sample for sample.
+    """
+    if not bit_exact:
+        return goertzel_levels_db(analysis_windows)
+
+    levels = np.empty(analysis_windows.shape[:-1])
+    for index in np.ndindex(levels.shape):
+        goertzel = GoertzelFilter(BAND_FREQS[index[-1]], TONE_ANALYSIS_SAMPLES)
+        goertzel.process_block(analysis_windows[index])
+        levels[index] = goertzel.get_power_db()
+    return levels
+
 # ============================================================================
 # RBJ BIQUAD FILTER (matching embedded)
 # ============================================================================
@@ -159,12 +263,44 @@ def design_rbj_biquad(fc: float, gain_db: float, Q: float) -> Tuple[np.ndarray,
 
     return b, a
 
-def apply_biquad_cascade(signal_data: np.ndarray, biquads: List[Tuple]) -> np.ndarray:
-    """Apply cascade of biquad filters."""
-    output = signal_data.copy()
-    for b, a in biquads:
-        output = signal.lfilter(b, a, output)
-    return output
+# RBJ terms that depend only on the fixed EQ10 band frequencies (float32, like BAND_FREQS)
+_BAND_W0 = 2 * np.pi * BAND_FREQS / FS
+_BAND_COS_W0 = np.cos(_BAND_W0)
+_BAND_SIN_W0 = np.sin(_BAND_W0)
+_BAND_ALPHA = _BAND_SIN_W0 / (2 * EQ_Q)
+
+def design_eq10_bank(gains: np.ndarray, Q: float = EQ_Q) -> np.ndarray:
+    """Design all ten EQ10 peaking biquads at once as a (bands, 6) SOS matrix.
+
+    Vectorized design_rbj_biquad() over BAND_FREQS; the per-band trig is
+    precomputed, so only the gain-dependent terms are evaluated per call.
+    """
+    A = 10**(np.asarray(gains, dtype=np.float32) / 40.0)
+    alpha = _BAND_ALPHA if Q == EQ_Q else _BAND_SIN_W0 / (2 * Q)
+    a0 = 1 + alpha / A
+    a1 = -2 * _BAND_COS_W0 / a0
+
+    # Normalize by a0 (b1 == a1 for the peaking EQ)
+    return np.column_stack([
+        (1 + alpha * A) / a0,
+        a1,
+        (1 - alpha * A) / a0,
+        np.ones(NUM_BANDS, dtype=np.float32),
+        a1,
+        (1 - alpha / A) / a0,
+    ]).astype(np.float32)
+
+def biquads_to_sos(biquads: List[Tuple]) -> np.ndarray:
+    """Pack (b, a) biquad pairs into a (sections, 6) SOS matrix."""
+    return np.stack([np.concatenate([b, a]) for b, a in biquads])
+
+def apply_biquad_cascade(signal_data: np.ndarray, sos: np.ndarray) -> np.ndarray:
+    """Apply cascade of biquad filters (one sosfilt call along the last axis).
+
+    Runs in single precision, like the embedded cascade.
+    """
+    return signal.sosfilt(sos.astype(np.float32, copy=False),
+                          signal_data.astype(np.float32, copy=False))
 
 # ============================================================================
 # ROOM SIMULATOR
@@ -173,34 +309,62 @@ def apply_biquad_cascade(signal_data: np.ndarray, biquads: List[Tuple]) -> np.nd
 class RoomSimulator:
     """Simulate room acoustics using biquad filters."""
 
-    def __init__(self, name: str, modes: List[Dict]):
+    def __init__(self, name: str, modes: List[Dict], seed=None):
         self.name = name
         self.modes = modes
-        self.biquads = []
-
-        for mode in modes:
-            b, a = design_rbj_biquad(mode['freq'], mode['gain_db'], mode['Q'])
-            self.biquads.append((b, a))
-
-    def process(self, signal_data: np.ndarray, add_noise: bool = True) -> np.ndarray:
-        """Process signal through room."""
-        output = apply_biquad_cascade(signal_data, self.biquads)
+        self.rng = np.random.default_rng(seed)  # Noise source owned by this room
+        self._responses: Dict[bool, np.ndarray] = {}
+        self.sos = biquads_to_sos([design_rbj_biquad(mode['freq'], mode['gain_db'], mode['Q'])
+                                   for mode in modes])
+
+    def process(self, signal_data: np.ndarray, add_noise: bool = True,
+                batch: int = None) -> np.ndarray:
+        """Process signal (or a stack of signals along the last axis) through room.
+
+        With batch, the room is simulated once and returned as `batch`
+        independent noisy recordings stacked along a new leading axis.
+        """
+        output = apply_biquad_cascade(signal_data, self.sos)
+        if batch is not None:
+            output = np.broadcast_to(output, (batch,) + output.shape)
 
         if add_noise:
-            # Add noise floor (-60 dB SNR)
-            noise_power = 10**(-60/20) * np.sqrt(np.mean(output**2))
-            noise = np.random.normal(0, noise_power, len(output))
-            output += noise
-
-        return output.astype(np.float32)
+            output = self.add_noise(output)
+
+        return output
+
+    def add_noise(self, output: np.ndarray) -> np.ndarray:
+        """Add a fresh noise realization to each signal along the last axis."""
+        # Noise floor (-60 dB SNR), relative to each signal's own level
+        noise_power = np.float32(10**(-60/20)) * np.sqrt(np.mean(output**2, axis=-1, keepdims=True))
+        noise = self.rng.standard_normal(output.shape, dtype=np.float32) * noise_power
+        return output + noise
+
+    def record_tones(self, bit_exact: bool = False) -> np.ndarray:
+        """Record every band's test tone through the room.
+
+        Tones and room are fixed, so the noiseless (bands, samples) room
+        response is simulated once and cached; every call adds fresh noise,
+        so repeated passes stay independent measurements.
+        """
+        response = self._responses.get(bit_exact)
+        if response is None:
+            response = self.process(get_tone_bank(bit_exact), add_noise=False)
+            response.flags.writeable = False
+            self._responses[bit_exact] = response
+        return self.add_noise(response)
 
 # ============================================================================
 # 10-ROOM TEST SUITE
 # ============================================================================
 
-def create_10_room_test_suite() -> List[RoomSimulator]:
-    """Create 10 diverse room scenarios for TRD validation."""
+def create_10_room_test_suite(seed: int = VALIDATION_SEED) -> List[RoomSimulator]:
+    """Create 10 diverse room scenarios for TRD validation.
 
+    Each room gets its own noise stream spawned from `seed`, so the campaign
+    is reproducible regardless of which worker process runs which room.
+    """
+    room_seeds = iter(np.random.SeedSequence(seed).spawn(10))
     rooms = []
 
     # Room 1: Strong bass buildup (modes at 50 Hz, 80 Hz)
@@ -210,7 +374,8 @@ def create_10_room_test_suite() -> List[RoomSimulator]:
             {'freq': 50, 'gain_db': 8.0, 'Q': 3.0},
             {'freq': 80, 'gain_db': 6.0, 'Q': 2.5},
             {'freq': 35, 'gain_db': -3.0, 'Q': 1.0},
-        ]
+        ],
+        seed=next(room_seeds)
     ))
 
     # Room 2: Bass null (cancellation at 100 Hz)
@@ -220,7 +385,8 @@ def create_10_room_test_suite() -> List[RoomSimulator]:
             {'freq': 100, 'gain_db': -8.0, 'Q': 2.0},
             {'freq': 60, 'gain_db': 3.0, 'Q': 1.5},
             {'freq': 150, 'gain_db': 2.0, 'Q': 1.5},
-        ]
+        ],
+        seed=next(room_seeds)
     ))
 
     # Room 3: Moderate room (typical small studio)
@@ -230,7 +396,8 @@ def create_10_room_test_suite() -> List[RoomSimulator]:
             {'freq': 55, 'gain_db': 4.0, 'Q': 2.0},
             {'freq': 110, 'gain_db': -3.0, 'Q': 1.5},
             {'freq': 220, 'gain_db': 2.0, 'Q': 1.5},
-        ]
+        ],
+        seed=next(room_seeds)
     ))
 
     # Room 4: Flat room (minimal correction needed)
@@ -239,7 +406,8 @@ def create_10_room_test_suite() -> List[RoomSimulator]:
         modes=[
             {'freq': 70, 'gain_db': 1.5, 'Q': 1.0},
             {'freq': 140, 'gain_db': -1.0, 'Q': 1.0},
-        ]
+        ],
+        seed=next(room_seeds)
     ))
 
     # Room 5: Severe room (multiple strong modes)
@@ -251,7 +419,8 @@ def create_10_room_test_suite() -> List[RoomSimulator]:
             {'freq': 135, 'gain_db': 7.0, 'Q': 2.5},
             {'freq': 180, 'gain_db': -4.0, 'Q': 1.5},
             {'freq': 270, 'gain_db': 5.0, 'Q': 2.0},
-        ]
+        ],
+        seed=next(room_seeds)
     ))
 
     # Room 6: Low-frequency only (mode at 30 Hz) - tests Band 1-2 correction
@@ -260,7 +429,8 @@ def create_10_room_test_suite() -> List[RoomSimulator]:
         modes=[
             {'freq': 30, 'gain_db': 9.0, 'Q': 4.0},
             {'freq': 60, 'gain_db': 2.0, 'Q': 1.5},
-        ]
+        ],
+        seed=next(room_seeds)
     ))
 
     # Room 7: Mid-bass emphasis (modes at 200-400 Hz) - tests Bands 5-7
@@ -270,7 +440,8 @@ def create_10_room_test_suite() -> List[RoomSimulator]:
             {'freq': 200, 'gain_db': 6.0, 'Q': 2.0},
             {'freq': 300, 'gain_db': 5.0, 'Q': 2.0},
             {'freq': 400, 'gain_db': 4.0, 'Q': 1.5},
-        ]
+        ],
+        seed=next(room_seeds)
     ))
 
     # Room 8: Broadband tilt (+3 dB/octave rising) - tests all bands
@@ -281,7 +452,8 @@ def create_10_room_test_suite() -> List[RoomSimulator]:
             {'freq': 100, 'gain_db': 0.0, 'Q': 0.5},
             {'freq': 400, 'gain_db': 4.0, 'Q': 0.5},
             {'freq': 1600, 'gain_db': 6.0, 'Q': 0.5},
-        ]
+        ],
+        seed=next(room_seeds)
     ))
 
     # Room 9: Comb filter pattern (alternating +4/-4 dB) - stress test
@@ -293,7 +465,8 @@ def create_10_room_test_suite() -> List[RoomSimulator]:
             {'freq': 160, 'gain_db': 5.0, 'Q': 2.0},
             {'freq': 320, 'gain_db': -5.0, 'Q': 2.0},
             {'freq': 640, 'gain_db': 5.0, 'Q': 2.0},
-        ]
+        ],
+        seed=next(room_seeds)
     ))
 
     # Room 10: Near-clipping room (modes requiring max ±12 dB correction)
@@ -303,7 +476,8 @@ def create_10_room_test_suite() -> List[RoomSimulator]:
             {'freq': 50, 'gain_db': 11.5, 'Q': 3.5},
             {'freq': 125, 'gain_db': -11.0, 'Q': 2.5},
             {'freq': 250, 'gain_db': 10.5, 'Q': 2.5},
-        ]
+        ],
+        seed=next(room_seeds)
     ))
 
     return rooms
@@ -312,33 +486,42 @@ def create_10_room_test_suite() -> List[RoomSimulator]:
 # QUICKTUNE ALGORITHM (bit-accurate to embedded C++)
 # ============================================================================
 
-def quicktune_measure_room(room: RoomSimulator) -> np.ndarray:
-    """Measure room response at all EQ10 bands."""
-    measured_levels = np.zeros(NUM_BANDS, dtype=np.float32)
+def simulate_analysis_windows(room: RoomSimulator, eq10_sos: np.ndarray = None,
+                              bit_exact: bool = False, batch: int = None) -> np.ndarray:
+    """Play every band's tone through the room (and EQ10) in one pass.
 
-    for band_idx, freq in enumerate(BAND_FREQS):
-        # Generate tone using recursive oscillator
-        tone_gen = RecursiveToneGenerator(freq)
-        tone = tone_gen.generate_tone()
-
-        # Pass through room
-        recorded = room.process(tone)
+    All bands run as a single (bands, samples) batch through tone -> room ->
+    EQ10, and only the analysis windows (after settling) are returned, as a
+    view with one row per band ready for Goertzel analysis. The room's
+    noiseless response is cached, so each pass only draws fresh noise and
+    runs the EQ10; with batch, that many independent noisy recordings are
+    made and returned along a leading axis.
+    """
+    if batch is None:
+        recorded = room.record_tones(bit_exact)
+    else:
+        recorded = room.process(get_tone_bank(bit_exact), batch=batch)
 
-        # Analyze with Goertzel (skip settling time)
-        analysis_window = recorded[TONE_SETTLING_SAMPLES:TONE_SETTLING_SAMPLES + TONE_ANALYSIS_SAMPLES]
-        goertzel = GoertzelFilter(freq, TONE_ANALYSIS_SAMPLES)
+    if eq10_sos is not None:
+        recorded = apply_biquad_cascade(recorded, eq10_sos)
 
-        for sample in analysis_window:
-            goertzel.process_sample(sample)
+    return recorded[..., TONE_SETTLING_SAMPLES:TONE_SETTLING_SAMPLES + TONE_ANALYSIS_SAMPLES]
 
-        level_db = goertzel.get_power_db()
+def quicktune_measure_room(room: RoomSimulator, bit_exact: bool = False,
+                           batch: int = None) -> np.ndarray:
+    """Measure room response at all EQ10 bands.
 
-        # Apply MEMS calibration
-        level_db += MEMS_CAL[band_idx]
+    bit_exact reproduces the embedded tone generator and Goertzel recursion
+    exactly instead of using their vectorized equivalents. batch measures
+    that many independent runs at once, returning shape (batch, bands).
+    """
+    # Play all band tones through the room, keeping the analysis windows
+    analysis_windows = simulate_analysis_windows(room, bit_exact=bit_exact, batch=batch)
 
-        measured_levels[band_idx] = level_db
+    # Analyze all bands with Goertzel, then apply MEMS calibration
+    measured_levels = measure_band_levels(analysis_windows, bit_exact) + MEMS_CAL
 
-    return measured_levels
+    return measured_levels.astype(np.float32)
 
 def quicktune_compute_correction(measured_levels: np.ndarray, target_db: float = 0.0) -> np.ndarray:
     """Compute correction gains."""
@@ -346,49 +529,58 @@ def quicktune_compute_correction(measured_levels: np.ndarray, target_db: float =
     correction = np.clip(correction, MIN_GAIN_DB, MAX_GAIN_DB)
     return correction.astype(np.float32)
 
-def quicktune_apply_correction(room: RoomSimulator, gains: np.ndarray) -> np.ndarray:
+def quicktune_apply_correction(room: RoomSimulator, gains: np.ndarray,
+                               bit_exact: bool = False) -> np.ndarray:
     """Apply correction and measure post-correction response."""
     # Build EQ10 cascade
-    eq10_biquads = []
-    for freq, gain in zip(BAND_FREQS, gains):
-        b, a = design_rbj_biquad(freq, gain, EQ_Q)
-        eq10_biquads.append((b, a))
+    eq10_sos = design_eq10_bank(gains)
 
     # Measure post-correction response
-    post_levels = np.zeros(NUM_BANDS, dtype=np.float32)
-
-    for band_idx, freq in enumerate(BAND_FREQS):
-        # Generate tone
-        tone_gen = RecursiveToneGenerator(freq)
-        tone = tone_gen.generate_tone()
+    analysis_windows = simulate_analysis_windows(room, eq10_sos, bit_exact)
 
-        # Pass through room
-        recorded = room.process(tone)
+    # Analyze all bands with Goertzel, then apply MEMS calibration
+    post_levels = measure_band_levels(analysis_windows, bit_exact) + MEMS_CAL
 
-        # Apply EQ10 correction
-        corrected = apply_biquad_cascade(recorded, eq10_biquads)
+    return post_levels.astype(np.float32)
 
-        # Analyze with Goertzel
-        analysis_window = corrected[TONE_SETTLING_SAMPLES:TONE_SETTLING_SAMPLES + TONE_ANALYSIS_SAMPLES]
-        goertzel = GoertzelFilter(freq, TONE_ANALYSIS_SAMPLES)
+def eq_gain_db_at_band(gains: np.ndarray) -> np.ndarray:
+    """Level change (dB) the EQ10 cascade applies at each band center.
 
-        for sample in analysis_window:
-            goertzel.process_sample(sample)
-
-        level_db = goertzel.get_power_db()
-
-        # Apply MEMS calibration
-        level_db += MEMS_CAL[band_idx]
-
-        post_levels[band_idx] = level_db
-
-    return post_levels
-
-def quicktune_iterative(room: RoomSimulator, max_iterations: int = MAX_ITERATIONS) -> Dict:
-    """Run QuickTune with iterative refinement."""
+    The EQ is LTI and every probe is a single sine, so this is the analytic
+    cascade response |H| at BAND_FREQS (all ten sections, including their
+    overlap into neighbouring bands).
+    """
+    _, h = signal.sosfreqz(design_eq10_bank(gains), worN=BAND_FREQS, fs=FS)
+    return 20.0 * np.log10(np.abs(h))
+
+def quicktune_predict_correction(measured_levels: np.ndarray, gains: np.ndarray) -> np.ndarray:
+    """Predict post-correction levels analytically, without simulating a pass."""
+    return (measured_levels + eq_gain_db_at_band(gains)).astype(np.float32)
+
+def quicktune_iterative(room: RoomSimulator, max_iterations: int = MAX_ITERATIONS,
+                        bit_exact: bool = False, predict: bool = False,
+                        early_exit: bool = False) -> Dict:
+    """Run QuickTune with iterative refinement.
+
+    Like the firmware, all max_iterations passes run and every pass measures
+    the corrected room. bit_exact runs every measurement through the
+    sample-exact embedded tone/Goertzel path (see quicktune_measure_room()).
+
+    predict and early_exit are opt-in fast modes that are never used for TRD
+    verdicts. predict evaluates intermediate passes on the analytic
+    prediction of the corrected response (quicktune_predict_correction())
+    instead of measuring them; the first and last passes (and, with
+    early_exit, any pass predicted within tolerance) are still measured, and
+    each measurement re-anchors the prediction. measured_iterations lists the
+    measured passes; error_history holds predicted errors for the others.
+    early_exit stops as soon as a measured pass is within tolerance.
+    """
 
     # Initial measurement
-    measured_levels = quicktune_measure_room(room)
+    measured_levels = quicktune_measure_room(room, bit_exact)
+
+    # Uncorrected room response the predictions are anchored to
+    room_levels = measured_levels
 
     # Compute initial correction
     correction_gains = quicktune_compute_correction(measured_levels)
@@ -397,20 +589,39 @@ def quicktune_iterative(room: RoomSimulator, max_iterations: int = MAX_ITERATION
     # Track convergence
     convergence_history = []
     error_history = []
+    measured_iterations = []
 
     for iteration in range(max_iterations):
-        # Measure with current correction
-        post_levels = quicktune_apply_correction(room, cumulative_gains)
+        last_iteration = iteration == max_iterations - 1
+
+        if predict:
+            # Predict the response with current correction
+            post_levels = quicktune_predict_correction(room_levels, cumulative_gains)
+            max_error = np.max(np.abs(post_levels - 0.0))
+
+        # Measure with current correction (in predict mode: the first pass,
+        # which has the largest gain change and so the largest model drift,
+        # and with early_exit any pass the prediction puts within tolerance)
+        measured = (not predict or iteration == 0 or last_iteration or
+                    (early_exit and max_error <= TRD_AUTO_EQ_TOLERANCE))
+        if measured:
+            post_levels = quicktune_apply_correction(room, cumulative_gains, bit_exact)
+            measured_iterations.append(iteration)
         residual_error = post_levels - 0.0
         max_error = np.max(np.abs(residual_error))
 
         convergence_history.append(cumulative_gains.copy())
         error_history.append(max_error)
 
-        # Check convergence
-        if iteration == max_iterations - 1:
+        # Check convergence (with early_exit, stop as soon as the measured
+        # correction is within tolerance)
+        if last_iteration or (early_exit and measured and max_error <= TRD_AUTO_EQ_TOLERANCE):
             break
 
+        # Re-anchor the prediction to the measurement it missed
+        if predict and measured:
+            room_levels = (post_levels - eq_gain_db_at_band(cumulative_gains)).astype(np.float32)
+
         # Compute refinement
         refinement = quicktune_compute_correction(post_levels)
         refinement *= DAMPING_FACTOR
@@ -419,8 +630,12 @@ def quicktune_iterative(room: RoomSimulator, max_iterations: int = MAX_ITERATION
         cumulative_gains += refinement
         cumulative_gains = np.clip(cumulative_gains, MIN_GAIN_DB, MAX_GAIN_DB)
 
-    # Final measurement
-    final_levels = quicktune_apply_correction(room, cumulative_gains)
+    # Final measurement: the loop exits right after measuring the current
+    # gains, so reuse that pass unless no pass ran
+    if measured_iterations:
+        final_levels = post_levels
+    else:
+        final_levels = quicktune_apply_correction(room, cumulative_gains, bit_exact)
     final_error = final_levels - 0.0
 
     return {
@@ -430,6 +645,7 @@ def quicktune_iterative(room: RoomSimulator, max_iterations: int = MAX_ITERATION
         'final_error': final_error,
         'convergence_history': convergence_history,
         'error_history': error_history,
+        'measured_iterations': measured_iterations,
         'max_error': np.max(np.abs(final_error)),
         'rms_error': np.sqrt(np.mean(final_error**2))
     }
@@ -438,8 +654,26 @@ def quicktune_iterative(room: RoomSimulator, max_iterations: int = MAX_ITERATION
 # TRD VALIDATION TESTS
 # ============================================================================
 
-def validate_trd_requirements(rooms: List[RoomSimulator]) -> Dict:
-    """Run all TRD validation tests."""
+def validate_room(room: RoomSimulator, bit_exact: bool = False) -> Dict:
+    """Run QuickTune on one room.
+
+    Rooms are independent (each owns its noise generator), so they are
+    validated in parallel worker processes.
+    """
+    result = quicktune_iterative(room, bit_exact=bit_exact)
+    result['room_name'] = room.name
+    result['room_short'] = room.name.split(':')[0]
+    result['plot_filename'] = room.name.replace(' ', '_').replace(':', '') + '.png'
+    return result
+
+def validate_trd_requirements(rooms: List[RoomSimulator], jobs: Optional[int] = None,
+                              bit_exact: bool = False) -> Dict:
+    """Run all TRD validation tests.
+
+    jobs caps the worker processes used for the rooms (None: one per CPU).
+    bit_exact measures through the sample-exact embedded tone/Goertzel path
+    and first checks that path against its per-sample references.
+    """
 
     print("="*80)
     print("QuickTune TRD Compliance Validation Campaign")
@@ -449,6 +683,7 @@ def validate_trd_requirements(rooms: List[RoomSimulator]) -> Dict:
     print(f"Block Size: {BLOCK_SIZE} samples")
     print(f"Number of Bands: {NUM_BANDS}")
     print(f"Test Rooms: {len(rooms)}")
+    print(f"Measurement Path: {'bit-exact (embedded parity)' if bit_exact else 'vectorized'}")
     print("="*80)
 
     # Store all results
@@ -458,18 +693,22 @@ def validate_trd_requirements(rooms: List[RoomSimulator]) -> Dict:
         'overall_status': None
     }
 
+    if bit_exact:
+        print("\n[BIT-EXACT] Reference Kernel Parity")
+        print("-" * 80)
+        results['bit_exact_parity'] = validate_bit_exact_parity()
+
     # Test each room
     print("\n" + "="*80)
     print("RUNNING ROOM VALIDATION TESTS")
     print("="*80)
 
-    for room_idx, room in enumerate(rooms):
-        print(f"\n[{room_idx+1}/{len(rooms)}] Testing: {room.name}")
-        print("-" * 80)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results['room_results'] = list(executor.map(validate_room, rooms, [bit_exact] * len(rooms)))
 
-        result = quicktune_iterative(room)
-        result['room_name'] = room.name
-        results['room_results'].append(result)
+    for room_idx, result in enumerate(results['room_results']):
+        print(f"\n[{room_idx+1}/{len(rooms)}] Testing: {result['room_name']}")
+        print("-" * 80)
 
         print(f"  Max Error: {result['max_error']:.3f} dB")
         print(f"  RMS Error: {result['rms_error']:.3f} dB")
@@ -537,7 +776,7 @@ def validate_trd_requirements(rooms: List[RoomSimulator]) -> Dict:
     # QT-STABLE-001: Measurement Repeatability
     print("\n[QT-STABLE-001] Measurement Repeatability")
     print("-" * 80)
-    stable_pass = validate_repeatability(rooms[0])  # Test with first room
+    stable_pass = validate_repeatability(rooms[0], bit_exact)  # Test with first room
     results['trd_compliance']['QT-STABLE-001'] = stable_pass
 
     # Determine overall status
@@ -832,11 +1071,12 @@ def validate_convergence(room_results: List[Dict]) -> Dict:
     converged_count = 0
 
     for result in room_results:
-        error_history = result['error_history']
-        # Check if error decreased across iterations
-        if len(error_history) > 1:
-            if error_history[-1] < error_history[0]:
-                converged_count += 1
+        # Judge only the passes measured on the simulated room, not the
+        # analytic predictions in between
+        measured_errors = np.array([result['error_history'][i] for i in result['measured_iterations']])
+        # Check if error decreased on every pass
+        if len(measured_errors) > 1 and np.all(np.diff(measured_errors) < 0):
+            converged_count += 1
 
     convergence_rate = converged_count / len(room_results)
     passed = convergence_rate >= 0.8  # 80% should show convergence
@@ -854,20 +1094,17 @@ def validate_convergence(room_results: List[Dict]) -> Dict:
         'priority': 'SHOULD'
     }
 
-def validate_repeatability(room: RoomSimulator) -> Dict:
+def validate_repeatability(room: RoomSimulator, bit_exact: bool = False) -> Dict:
     """Validate QT-STABLE-001: Measurement repeatability."""
     # Run QuickTune 10 times on same room, measure variation
 
     num_runs = 10
-    all_gains = []
 
     print(f"  Running {num_runs} repeated measurements on {room.name}...")
 
-    for run in range(num_runs):
-        result = quicktune_iterative(room, max_iterations=1)  # Single pass for speed
-        all_gains.append(result['final_gains'])
-
-    all_gains = np.array(all_gains)
+    # Single-pass QuickTune gains depend only on the initial measurement, so
+    # measure all runs (independent noise) as one batch
+    all_gains = quicktune_compute_correction(quicktune_measure_room(room, bit_exact, batch=num_runs))
     std_devs = np.std(all_gains, axis=0)
     max_std_dev = np.max(std_devs)
 
@@ -887,177 +1124,278 @@ def validate_repeatability(room: RoomSimulator) -> Dict:
         'priority': 'MUST'
     }
 
+def validate_bit_exact_parity(band_idx: int = 0) -> Dict:
+    """Check the bit-exact measurement path against its references on one band.
+
+    generate_tone_exact() and GoertzelFilter.process_block() must match the
+    generate_sample()/process_sample() loops bit for bit; the vectorized
+    measurement (closed-form tone + goertzel_levels_db()) is compared with
+    the bit-exact level.
+    """
+    freq = BAND_FREQS[band_idx]
+
+    # Tone: block recursion vs the sample-by-sample oscillator
+    reference = RecursiveToneGenerator(freq)
+    reference_tone = np.array([reference.generate_sample(n) for n in range(TONE_TOTAL_SAMPLES)],
+                              dtype=np.float32)
+    tone_identical = np.array_equal(RecursiveToneGenerator(freq).generate_tone_exact(), reference_tone)
+
+    # Goertzel: block recursion vs the sample-by-sample filter
+    window = reference_tone[TONE_SETTLING_SAMPLES:TONE_SETTLING_SAMPLES + TONE_ANALYSIS_SAMPLES]
+    reference_goertzel = GoertzelFilter(freq, TONE_ANALYSIS_SAMPLES)
+    for sample in window:
+        reference_goertzel.process_sample(sample)
+    block_goertzel = GoertzelFilter(freq, TONE_ANALYSIS_SAMPLES)
+    block_goertzel.process_block(window)
+    goertzel_identical = (block_goertzel.s1 == reference_goertzel.s1 and
+                          block_goertzel.s2 == reference_goertzel.s2)
+
+    # Vectorized path vs the bit-exact level
+    fast_windows = np.zeros((NUM_BANDS, TONE_ANALYSIS_SAMPLES), dtype=np.float32)
+    fast_windows[band_idx] = get_tone(freq)[TONE_SETTLING_SAMPLES:TONE_SETTLING_SAMPLES + TONE_ANALYSIS_SAMPLES]
+    fast_deviation = abs(goertzel_levels_db(fast_windows)[band_idx] - reference_goertzel.get_power_db())
+
+    passed = tone_identical and goertzel_identical and fast_deviation <= BIT_EXACT_FAST_TOLERANCE
+
+    print(f"  Band: {int(freq)} Hz")
+    print(f"  Tone (generate_tone_exact vs generate_sample): {'identical' if tone_identical else 'MISMATCH'}")
+    print(f"  Goertzel (process_block vs process_sample): {'identical' if goertzel_identical else 'MISMATCH'}")
+    print(f"  Vectorized vs bit-exact level: {fast_deviation:.2e} dB")
+    print(f"  Specification: bit-identical kernels, vectorized within {BIT_EXACT_FAST_TOLERANCE} dB")
+    print(f"  Status: {'PASS' if passed else 'FAIL'}")
+
+    return {
+        'tone_identical': tone_identical,
+        'goertzel_identical': goertzel_identical,
+        'fast_deviation_db': fast_deviation,
+        'pass': passed
+    }
+
 # ============================================================================
 # PLOTTING
 # ============================================================================
 
-def plot_room_results(result: Dict, plot_dir: str):
-    """Generate per-room validation plots."""
+# Bar/line charts and labels stay legible at 100 dpi; 150 dpi cost 2.25x the pixels
+PLOT_DPI = 100
+
+# Per-band bar positions and frequency tick labels, shared by the room plots
+BAND_INDICES = np.arange(NUM_BANDS)
+BAND_TICK_LABELS = [f'{int(f)}' for f in BAND_FREQS]
 
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+def _pyplot():
+    """Import pyplot on first use, so callers that never plot skip its import cost."""
+    import matplotlib
+    matplotlib.use('Agg')  # Plots are only saved to PNG; skip GUI backend setup
+    import matplotlib.pyplot as plt
+    return plt
+
+def plot_room_results(result: Dict, plot_dir: str, axes: Optional[np.ndarray] = None) -> str:
+    """Generate per-room validation plots and return the saved PNG path.
+
+    axes is an optional 2x2 Axes grid to draw into; it is cleared and reused
+    so a room loop builds the figure only once. Without it a figure is
+    created and closed here.
+    """
+
+    plt = _pyplot()
+    if axes is None:
+        fig, axes = plt.subplots(2, 2, figsize=(14, 10), layout='constrained')
+        owns_figure = True
+    else:
+        fig = axes[0, 0].figure
+        owns_figure = False
+        for ax in axes.flat:
+            ax.clear()
     fig.suptitle(f'QuickTune TRD Validation: {result["room_name"]}',
                  fontsize=14, fontweight='bold')
 
     # Plot 1: Before/After Response
     ax1 = axes[0, 0]
-    ax1.semilogx(BAND_FREQS, result['measured_levels'], 'o-', color='red',
-                 linewidth=2, markersize=8, label='Before Correction')
-    ax1.semilogx(BAND_FREQS, result['final_levels'], 's-', color='green',
-                 linewidth=2, markersize=8, label='After Correction')
+    ax1.plot(BAND_FREQS, result['measured_levels'], 'o-', color='red',
+             linewidth=2, markersize=8, label='Before Correction')
+    ax1.plot(BAND_FREQS, result['final_levels'], 's-', color='green',
+             linewidth=2, markersize=8, label='After Correction')
     ax1.axhline(0, color='black', linestyle='--', linewidth=1, label='Target (0 dB)')
     ax1.fill_between(BAND_FREQS, -TRD_AUTO_EQ_TOLERANCE, TRD_AUTO_EQ_TOLERANCE,
                      color='green', alpha=0.2, label=f'±{TRD_AUTO_EQ_TOLERANCE} dB Target')
-    ax1.set_xlabel('Frequency (Hz)')
-    ax1.set_ylabel('Level (dB)')
-    ax1.set_title('Frequency Response')
+    ax1.set(xscale='log', xlim=[20, 2000], ylim=[-15, 15],
+            xlabel='Frequency (Hz)', ylabel='Level (dB)', title='Frequency Response')
     ax1.grid(True, which='both', alpha=0.3)
     ax1.legend()
-    ax1.set_xlim([20, 2000])
-    ax1.set_ylim([-15, 15])
 
     # Plot 2: Correction Gains
     ax2 = axes[0, 1]
-    colors = ['red' if abs(g) > MAX_GAIN_DB*0.8 else 'orange' if abs(g) > MAX_GAIN_DB*0.5 else 'green'
-              for g in result['final_gains']]
-    ax2.bar(range(NUM_BANDS), result['final_gains'], color=colors, alpha=0.7, edgecolor='black')
+    abs_gains = np.abs(result['final_gains'])
+    colors = np.where(abs_gains > MAX_GAIN_DB*0.8, 'red',
+                      np.where(abs_gains > MAX_GAIN_DB*0.5, 'orange', 'green'))
+    ax2.bar(BAND_INDICES, result['final_gains'], color=colors, alpha=0.7, edgecolor='black', rasterized=True)
     ax2.axhline(0, color='black', linestyle='-', linewidth=1)
     ax2.axhline(MAX_GAIN_DB, color='red', linestyle='--', linewidth=1, label=f'±{MAX_GAIN_DB} dB Limit')
     ax2.axhline(-MAX_GAIN_DB, color='red', linestyle='--', linewidth=1)
-    ax2.set_xlabel('EQ10 Band')
-    ax2.set_ylabel('Correction Gain (dB)')
-    ax2.set_title('EQ10 Correction Gains')
-    ax2.set_xticks(range(NUM_BANDS))
-    ax2.set_xticklabels([f'{int(f)}' for f in BAND_FREQS], rotation=45, ha='right')
+    ax2.set(xticks=BAND_INDICES, ylim=[-MAX_GAIN_DB-2, MAX_GAIN_DB+2],
+            xlabel='EQ10 Band', ylabel='Correction Gain (dB)', title='EQ10 Correction Gains')
+    ax2.set_xticklabels(BAND_TICK_LABELS, rotation=45, ha='right')
     ax2.grid(True, axis='y', alpha=0.3)
     ax2.legend()
-    ax2.set_ylim([-MAX_GAIN_DB-2, MAX_GAIN_DB+2])
 
     # Plot 3: Residual Error
     ax3 = axes[1, 0]
-    colors = ['green' if abs(e) <= TRD_AUTO_EQ_TOLERANCE else 'orange' if abs(e) <= 2.0 else 'red'
-              for e in result['final_error']]
-    ax3.bar(range(NUM_BANDS), result['final_error'], color=colors, alpha=0.7, edgecolor='black')
+    abs_errors = np.abs(result['final_error'])
+    colors = np.where(abs_errors <= TRD_AUTO_EQ_TOLERANCE, 'green',
+                      np.where(abs_errors <= 2.0, 'orange', 'red'))
+    ax3.bar(BAND_INDICES, result['final_error'], color=colors, alpha=0.7, edgecolor='black', rasterized=True)
     ax3.axhline(0, color='black', linestyle='-', linewidth=1)
     ax3.axhline(TRD_AUTO_EQ_TOLERANCE, color='green', linestyle='--', linewidth=1,
                 label=f'±{TRD_AUTO_EQ_TOLERANCE} dB Target')
     ax3.axhline(-TRD_AUTO_EQ_TOLERANCE, color='green', linestyle='--', linewidth=1)
-    ax3.set_xlabel('EQ10 Band')
-    ax3.set_ylabel('Residual Error (dB)')
-    ax3.set_title('Post-Correction Residual Error')
-    ax3.set_xticks(range(NUM_BANDS))
-    ax3.set_xticklabels([f'{int(f)}' for f in BAND_FREQS], rotation=45, ha='right')
+    ax3.set(xticks=BAND_INDICES, ylim=[-3, 3],
+            xlabel='EQ10 Band', ylabel='Residual Error (dB)', title='Post-Correction Residual Error')
+    ax3.set_xticklabels(BAND_TICK_LABELS, rotation=45, ha='right')
     ax3.grid(True, axis='y', alpha=0.3)
     ax3.legend()
-    ax3.set_ylim([-3, 3])
 
     # Plot 4: Convergence History
     ax4 = axes[1, 1]
     if len(result['error_history']) > 1:
-        iterations = range(len(result['error_history']))
-        ax4.plot(iterations, result['error_history'], 'o-', linewidth=2, markersize=8, color='blue')
+        # Filled markers: passes measured on the simulated room; hollow: predicted
+        error_history = np.asarray(result['error_history'])
+        iterations = np.arange(len(error_history))
+        measured = np.zeros(len(error_history), dtype=bool)
+        measured[result['measured_iterations']] = True
+        ax4.plot(iterations, error_history, '-', linewidth=2, color='blue')
+        ax4.plot(iterations[~measured], error_history[~measured], 'o', markersize=8, color='blue',
+                 markerfacecolor='white', label='Predicted')
+        ax4.plot(iterations[measured], error_history[measured], 'o', markersize=8, color='blue',
+                 label='Measured')
         ax4.axhline(TRD_AUTO_EQ_TOLERANCE, color='green', linestyle='--', linewidth=1,
                     label=f'Target: {TRD_AUTO_EQ_TOLERANCE} dB')
-        ax4.set_xlabel('Iteration')
-        ax4.set_ylabel('Max Error (dB)')
-        ax4.set_title('Convergence History')
+        ax4.set(xlabel='Iteration', ylabel='Max Error (dB)', title='Convergence History')
         ax4.grid(True, alpha=0.3)
         ax4.legend()
     else:
         ax4.text(0.5, 0.5, 'No iteration data', ha='center', va='center', transform=ax4.transAxes)
 
-    plt.tight_layout()
-
     # Save plot
-    filename = result['room_name'].replace(' ', '_').replace(':', '')
-    filepath = os.path.join(plot_dir, f'{filename}.png')
-    plt.savefig(filepath, dpi=150, bbox_inches='tight')
-    plt.close()
+    filepath = os.path.join(plot_dir, result['plot_filename'])
+    fig.savefig(filepath, dpi=PLOT_DPI)
+    if owns_figure:
+        plt.close(fig)
+
+    return filepath
+
+# Per-process Axes grid reused by plot_room_worker()
+_ROOM_AXES = None
 
-    print(f"  Plot saved: {filepath}")
+def plot_room_worker(result: Dict, plot_dir: str) -> str:
+    """Plot one room in a worker process, reusing that process's figure.
+
+    Rooms plot independently to distinct files, so main() renders them in
+    parallel worker processes.
+    """
+    global _ROOM_AXES
+    if _ROOM_AXES is None:
+        _, _ROOM_AXES = _pyplot().subplots(2, 2, figsize=(14, 10), layout='constrained')
+    return plot_room_results(result, plot_dir, _ROOM_AXES)
 
 def plot_summary(results: Dict, plot_dir: str):
     """Generate summary validation plots."""
 
     room_results = results['room_results']
+    num_rooms = len(room_results)
 
-    fig = plt.figure(figsize=(16, 12))
-    gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+    # Per-room aggregates, gathered in a single pass
+    room_names = [None] * num_rooms
+    max_errors = np.empty(num_rooms)
+    rms_errors = np.empty(num_rooms)
+    all_errors = np.empty(num_rooms * NUM_BANDS)
+    for i, r in enumerate(room_results):
+        room_names[i] = r['room_short']
+        max_errors[i] = r['max_error']
+        rms_errors[i] = r['rms_error']
+        all_errors[i*NUM_BANDS:(i+1)*NUM_BANDS] = r['final_error']
+
+    plt = _pyplot()
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+    fig = plt.figure(figsize=(16, 12), layout='constrained')
+    gs = fig.add_gridspec(3, 3)
 
     fig.suptitle('QuickTune TRD Compliance Validation Summary',
                  fontsize=16, fontweight='bold')
 
     # Plot 1: Max Error per Room
     ax1 = fig.add_subplot(gs[0, 0])
-    room_names = [r['room_name'].split(':')[0] for r in room_results]
-    max_errors = [r['max_error'] for r in room_results]
-    colors = ['green' if e <= TRD_AUTO_EQ_TOLERANCE else 'red' for e in max_errors]
-    ax1.bar(range(len(room_results)), max_errors, color=colors, alpha=0.7, edgecolor='black')
+    colors = np.where(max_errors <= TRD_AUTO_EQ_TOLERANCE, 'green', 'red')
+    ax1.bar(range(num_rooms), max_errors, color=colors, alpha=0.7, edgecolor='black', rasterized=True)
     ax1.axhline(TRD_AUTO_EQ_TOLERANCE, color='green', linestyle='--', linewidth=2)
-    ax1.set_xlabel('Room')
-    ax1.set_ylabel('Max Error (dB)')
-    ax1.set_title('Max Error per Room')
-    ax1.set_xticks(range(len(room_results)))
+    ax1.set(xticks=range(num_rooms), xlabel='Room', ylabel='Max Error (dB)',
+            title='Max Error per Room')
     ax1.set_xticklabels(room_names, rotation=45, ha='right', fontsize=8)
     ax1.grid(True, axis='y', alpha=0.3)
 
     # Plot 2: RMS Error per Room
     ax2 = fig.add_subplot(gs[0, 1])
-    rms_errors = [r['rms_error'] for r in room_results]
-    ax2.bar(range(len(room_results)), rms_errors, color='skyblue', alpha=0.7, edgecolor='black')
-    ax2.set_xlabel('Room')
-    ax2.set_ylabel('RMS Error (dB)')
-    ax2.set_title('RMS Error per Room')
-    ax2.set_xticks(range(len(room_results)))
+    ax2.bar(range(num_rooms), rms_errors, color='skyblue', alpha=0.7, edgecolor='black', rasterized=True)
+    ax2.set(xticks=range(num_rooms), xlabel='Room', ylabel='RMS Error (dB)',
+            title='RMS Error per Room')
     ax2.set_xticklabels(room_names, rotation=45, ha='right', fontsize=8)
     ax2.grid(True, axis='y', alpha=0.3)
 
     # Plot 3: Error Distribution
     ax3 = fig.add_subplot(gs[0, 2])
-    all_errors = np.concatenate([r['final_error'] for r in room_results])
-    ax3.hist(all_errors, bins=20, color='skyblue', edgecolor='black', alpha=0.7)
+    ax3.hist(all_errors, bins=20, color='skyblue', edgecolor='black', alpha=0.7, rasterized=True)
     ax3.axvline(-TRD_AUTO_EQ_TOLERANCE, color='green', linestyle='--', linewidth=2)
     ax3.axvline(TRD_AUTO_EQ_TOLERANCE, color='green', linestyle='--', linewidth=2)
     ax3.axvline(0, color='black', linestyle='-', linewidth=1)
-    ax3.set_xlabel('Residual Error (dB)')
-    ax3.set_ylabel('Count')
-    ax3.set_title('Error Distribution (All Rooms)')
+    ax3.set(xlabel='Residual Error (dB)', ylabel='Count', title='Error Distribution (All Rooms)')
     ax3.grid(True, axis='y', alpha=0.3)
 
     # Plot 4: Convergence Comparison
+    # All curves go into one LineCollection (plus one marker scatter) instead of
+    # a Line2D per room; the legend uses undrawn proxy lines. Markers of passes
+    # that were only predicted, not measured, are hollow
     ax4 = fig.add_subplot(gs[1, :])
-    for idx, result in enumerate(room_results):
-        if len(result['error_history']) > 1:
-            ax4.plot(result['error_history'], 'o-', linewidth=1.5, markersize=5,
-                    label=room_names[idx], alpha=0.7)
-    ax4.axhline(TRD_AUTO_EQ_TOLERANCE, color='green', linestyle='--', linewidth=2,
-                label=f'Target: {TRD_AUTO_EQ_TOLERANCE} dB')
-    ax4.set_xlabel('Iteration')
-    ax4.set_ylabel('Max Error (dB)')
-    ax4.set_title('Convergence Curves (All Rooms)')
+    curve_names = [room_names[idx] for idx, r in enumerate(room_results) if len(r['error_history']) > 1]
+    curves = [np.column_stack((np.arange(len(r['error_history'])), r['error_history']))
+              for r in room_results if len(r['error_history']) > 1]
+    curve_colors = [f'C{i % 10}' for i in range(len(curves))]
+    legend_handles = []
+    title = 'Convergence Curves (All Rooms)'
+    if curves:
+        ax4.add_collection(LineCollection(curves, colors=curve_colors, linewidths=1.5, alpha=0.7))
+        points = np.concatenate(curves)
+        point_colors = np.repeat(curve_colors, [len(c) for c in curves])
+        point_measured = np.concatenate([np.isin(np.arange(len(r['error_history'])), r['measured_iterations'])
+                                         for r in room_results if len(r['error_history']) > 1])
+        ax4.scatter(points[:, 0], points[:, 1], s=25, zorder=3, edgecolors=point_colors,
+                    facecolors=np.where(point_measured, point_colors, 'white'))
+        if not point_measured.all():
+            title = 'Convergence Curves (All Rooms; hollow markers = predicted passes)'
+        legend_handles = [Line2D([], [], color=color, marker='o', linewidth=1.5, markersize=5,
+                                 alpha=0.7, label=name)
+                          for name, color in zip(curve_names, curve_colors)]
+    legend_handles.append(ax4.axhline(TRD_AUTO_EQ_TOLERANCE, color='green', linestyle='--', linewidth=2,
+                                      label=f'Target: {TRD_AUTO_EQ_TOLERANCE} dB'))
+    ax4.set(xlabel='Iteration', ylabel='Max Error (dB)', title=title)
     ax4.grid(True, alpha=0.3)
-    ax4.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
+    ax4.legend(handles=legend_handles, bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
 
     # Plot 5: TRD Compliance Summary
     ax5 = fig.add_subplot(gs[2, :2])
     trd_reqs = list(results['trd_compliance'].keys())
     trd_status = [1 if results['trd_compliance'][req]['pass'] else 0 for req in trd_reqs]
     colors = ['green' if s else 'red' for s in trd_status]
-    ax5.barh(range(len(trd_reqs)), trd_status, color=colors, alpha=0.7, edgecolor='black')
-    ax5.set_yticks(range(len(trd_reqs)))
+    ax5.barh(range(len(trd_reqs)), trd_status, color=colors, alpha=0.7, edgecolor='black', rasterized=True)
+    ax5.set(yticks=range(len(trd_reqs)), xlim=[0, 1.2], xticks=[0, 1], xticklabels=['FAIL', 'PASS'],
+            xlabel='Status', title='TRD Requirements Compliance')
     ax5.set_yticklabels(trd_reqs, fontsize=9)
-    ax5.set_xlabel('Status')
-    ax5.set_title('TRD Requirements Compliance')
-    ax5.set_xlim([0, 1.2])
-    ax5.set_xticks([0, 1])
-    ax5.set_xticklabels(['FAIL', 'PASS'])
     ax5.grid(True, axis='x', alpha=0.3)
 
     # Plot 6: Overall Summary Text
     ax6 = fig.add_subplot(gs[2, 2])
     ax6.axis('off')
 
-    num_rooms = len(room_results)
-    num_passed = sum(1 for r in room_results if r['max_error'] <= TRD_AUTO_EQ_TOLERANCE)
+    num_passed = int(np.count_nonzero(max_errors <= TRD_AUTO_EQ_TOLERANCE))
     pass_rate = num_passed / num_rooms * 100
 
     must_pass = sum(1 for req in results['trd_compliance'].values()
@@ -1093,166 +1431,176 @@ def plot_summary(results: Dict, plot_dir: str):
              verticalalignment='center',
              bbox=dict(boxstyle='round', facecolor=status_color, alpha=0.3))
 
-    plt.savefig(os.path.join(plot_dir, 'validation_summary.png'), dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(os.path.join(plot_dir, 'validation_summary.png'), dpi=PLOT_DPI)
+    plt.close(fig)
 
     print(f"\nSummary plot saved: {os.path.join(plot_dir, 'validation_summary.png')}")
 
 def generate_report(results: Dict, output_path: str):
     """Generate markdown validation report."""
 
-    report = []
-    report.append("# QuickTune TRD Compliance Validation Report")
-    report.append("")
-    report.append(f"**Test Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append(f"**DUT:** QuickTune Algorithm (Embedded C++ + Python Validation)")
-    report.append(f"**Sample Rate:** {FS} Hz")
-    report.append(f"**Validation Agent:** DSP Team")
-    report.append("")
-    report.append("---")
-    report.append("")
-
-    # Executive Summary
-    report.append("## Executive Summary")
-    report.append("")
-    status = results['overall_status']
-    report.append(f"**Overall Validation Status:** **{status}**")
-    report.append("")
-
-    if status == 'PASS':
-        report.append("All MUST requirements met, ≥80% of SHOULD requirements met.")
-        report.append("QuickTune is ready for milestone review and deployment.")
-    elif status == 'CAUTION':
-        report.append("All MUST requirements met, <80% of SHOULD requirements met.")
-        report.append("QuickTune meets critical requirements but has minor issues.")
-    else:
-        report.append("One or more MUST requirements failed.")
-        report.append("QuickTune requires additional work before deployment.")
-    report.append("")
-    report.append("---")
-    report.append("")
-
-    # TRD Compliance Table
-    report.append("## TRD Requirements Compliance")
-    report.append("")
-    report.append("| Req ID | Requirement | Specification | Measured | Pass/Fail | Priority |")
-    report.append("|--------|-------------|---------------|----------|-----------|----------|")
-
-    for req_id, req_data in results['trd_compliance'].items():
-        status_str = "PASS" if req_data['pass'] else "FAIL"
-        report.append(f"| {req_id} | {req_data['requirement']} | {req_data['specification']} | "
-                     f"{req_data['measured']} | **{status_str}** | {req_data['priority']} |")
-
-    report.append("")
-    report.append("---")
-    report.append("")
-
-    # Per-Room Results
-    report.append("## Per-Room Validation Results")
-    report.append("")
-    report.append("| Room | Max Error (dB) | RMS Error (dB) | Pass/Fail |")
-    report.append("|------|----------------|----------------|-----------|")
-
-    for result in results['room_results']:
-        status_str = "PASS" if result['max_error'] <= TRD_AUTO_EQ_TOLERANCE else "FAIL"
-        report.append(f"| {result['room_name']} | {result['max_error']:.3f} | "
-                     f"{result['rms_error']:.3f} | **{status_str}** |")
-
-    report.append("")
-    report.append("---")
-    report.append("")
-
-    # Summary Statistics
-    report.append("## Summary Statistics")
-    report.append("")
-
-    num_rooms = len(results['room_results'])
-    num_passed = sum(1 for r in results['room_results'] if r['max_error'] <= TRD_AUTO_EQ_TOLERANCE)
-    pass_rate = num_passed / num_rooms * 100
-    avg_max_error = np.mean([r['max_error'] for r in results['room_results']])
-    avg_rms_error = np.mean([r['rms_error'] for r in results['room_results']])
-
-    report.append(f"- **Total Rooms Tested:** {num_rooms}")
-    report.append(f"- **Rooms Passed:** {num_passed} ({pass_rate:.0f}%)")
-    report.append(f"- **Average Max Error:** {avg_max_error:.3f} dB")
-    report.append(f"- **Average RMS Error:** {avg_rms_error:.3f} dB")
-    report.append(f"- **Target Accuracy:** ±{TRD_AUTO_EQ_TOLERANCE} dB")
-    report.append("")
-    report.append("---")
-    report.append("")
-
-    # Known Issues
-    report.append("## Known Issues")
-    report.append("")
-
-    failed_reqs = [req_id for req_id, req_data in results['trd_compliance'].items()
-                   if not req_data['pass']]
-
-    if failed_reqs:
-        report.append("The following requirements did not pass:")
-        report.append("")
-        for req_id in failed_reqs:
-            req_data = results['trd_compliance'][req_id]
-            report.append(f"- **{req_id}:** {req_data['requirement']}")
-            report.append(f"  - Specification: {req_data['specification']}")
-            report.append(f"  - Measured: {req_data['measured']}")
-            report.append("")
-    else:
-        report.append("No issues detected. All TRD requirements passed.")
-        report.append("")
-
-    report.append("---")
-    report.append("")
-
-    # Plots
-    report.append("## Validation Plots")
-    report.append("")
-    report.append("Detailed plots are available in the `plots/` directory:")
-    report.append("")
-    report.append("- `validation_summary.png` — Overall summary")
-
-    for result in results['room_results']:
-        filename = result['room_name'].replace(' ', '_').replace(':', '') + '.png'
-        report.append(f"- `{filename}` — {result['room_name']}")
-
-    report.append("")
-    report.append("---")
-    report.append("")
-
-    # Ready for Milestone Review
-    report.append("## Ready for Milestone Review")
-    report.append("")
-
-    if status == 'PASS':
-        report.append("**YES** - QuickTune has passed all critical TRD requirements.")
-        report.append("")
-        report.append("### Next Steps")
-        report.append("")
-        report.append("1. Documentation agent: Generate TRD and milestone report")
-        report.append("2. Implementation agent: Build binary for STM32H562")
-        report.append("3. Program manager review: Schedule milestone delivery")
-    else:
-        report.append(f"**NO** - QuickTune has status: {status}")
-        report.append("")
-        report.append("### Blockers")
-        report.append("")
-        for req_id in failed_reqs:
-            report.append(f"- {req_id} must be resolved")
-        report.append("")
-        report.append("### Next Steps")
-        report.append("")
-        report.append("1. Implementation agent: Address failed requirements")
-        report.append("2. Validation agent: Re-run TRD validation")
-
-    report.append("")
-    report.append("---")
-    report.append("")
-    report.append("*Generated by Validation Agent*")
-    report.append(f"*{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-
-    # Write report
-    with open(output_path, 'w') as f:
-        f.write('\n'.join(report))
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    # Stream the report straight to disk; the large buffer batches the writes
+    with open(output_path, 'w', buffering=1 << 20) as f:
+        def line(text: str = ''):
+            f.write(text)
+            f.write('\n')
+
+        line("# QuickTune TRD Compliance Validation Report")
+        line()
+        line(f"**Test Date:** {now_str}")
+        line(f"**DUT:** QuickTune Algorithm (Embedded C++ + Python Validation)")
+        line(f"**Sample Rate:** {FS} Hz")
+        line(f"**Validation Agent:** DSP Team")
+        line()
+        line("---")
+        line()
+
+        # Executive Summary
+        line("## Executive Summary")
+        line()
+        status = results['overall_status']
+        line(f"**Overall Validation Status:** **{status}**")
+        line()
+
+        if status == 'PASS':
+            line("All MUST requirements met, ≥80% of SHOULD requirements met.")
+            line("QuickTune is ready for milestone review and deployment.")
+        elif status == 'CAUTION':
+            line("All MUST requirements met, <80% of SHOULD requirements met.")
+            line("QuickTune meets critical requirements but has minor issues.")
+        else:
+            line("One or more MUST requirements failed.")
+            line("QuickTune requires additional work before deployment.")
+        line()
+        line("---")
+        line()
+
+        # TRD Compliance Table
+        line("## TRD Requirements Compliance")
+        line()
+        line("| Req ID | Requirement | Specification | Measured | Pass/Fail | Priority |")
+        line("|--------|-------------|---------------|----------|-----------|----------|")
+
+        for req_id, req_data in results['trd_compliance'].items():
+            status_str = "PASS" if req_data['pass'] else "FAIL"
+            line('| ' + ' | '.join((req_id, req_data['requirement'], req_data['specification'],
+                                     str(req_data['measured']), f'**{status_str}**',
+                                     req_data['priority'])) + ' |')
+
+        line()
+        line("---")
+        line()
+
+        # Per-Room Results
+        line("## Per-Room Validation Results")
+        line()
+        line("| Room | Max Error (dB) | RMS Error (dB) | Pass/Fail |")
+        line("|------|----------------|----------------|-----------|")
+
+        for result in results['room_results']:
+            status_str = "PASS" if result['max_error'] <= TRD_AUTO_EQ_TOLERANCE else "FAIL"
+            line('| ' + ' | '.join((result['room_name'], f"{result['max_error']:.3f}",
+                                     f"{result['rms_error']:.3f}", f'**{status_str}**')) + ' |')
+
+        line()
+        line("---")
+        line()
+
+        # Summary Statistics
+        line("## Summary Statistics")
+        line()
+
+        # Pass count and both error means in a single pass over the rooms
+        num_rooms = len(results['room_results'])
+        num_passed = 0
+        sum_max_error = 0.0
+        sum_rms_error = 0.0
+        for r in results['room_results']:
+            num_passed += int(r['max_error'] <= TRD_AUTO_EQ_TOLERANCE)
+            sum_max_error += float(r['max_error'])
+            sum_rms_error += float(r['rms_error'])
+        pass_rate = num_passed / num_rooms * 100
+        avg_max_error = sum_max_error / num_rooms
+        avg_rms_error = sum_rms_error / num_rooms
+
+        line(f"- **Total Rooms Tested:** {num_rooms}")
+        line(f"- **Rooms Passed:** {num_passed} ({pass_rate:.0f}%)")
+        line(f"- **Average Max Error:** {avg_max_error:.3f} dB")
+        line(f"- **Average RMS Error:** {avg_rms_error:.3f} dB")
+        line(f"- **Target Accuracy:** ±{TRD_AUTO_EQ_TOLERANCE} dB")
+        line()
+        line("---")
+        line()
+
+        # Known Issues
+        line("## Known Issues")
+        line()
+
+        failed_reqs = [req_id for req_id, req_data in results['trd_compliance'].items()
+                       if not req_data['pass']]
+
+        if failed_reqs:
+            line("The following requirements did not pass:")
+            line()
+            for req_id in failed_reqs:
+                req_data = results['trd_compliance'][req_id]
+                line(f"- **{req_id}:** {req_data['requirement']}")
+                line(f"  - Specification: {req_data['specification']}")
+                line(f"  - Measured: {req_data['measured']}")
+                line()
+        else:
+            line("No issues detected. All TRD requirements passed.")
+            line()
+
+        line("---")
+        line()
+
+        # Plots
+        line("## Validation Plots")
+        line()
+        line("Detailed plots are available in the `plots/` directory:")
+        line()
+        line("- `validation_summary.png` — Overall summary")
+
+        for result in results['room_results']:
+            line(f"- `{result['plot_filename']}` — {result['room_name']}")
+
+        line()
+        line("---")
+        line()
+
+        # Ready for Milestone Review
+        line("## Ready for Milestone Review")
+        line()
+
+        if status == 'PASS':
+            line("**YES** - QuickTune has passed all critical TRD requirements.")
+            line()
+            line("### Next Steps")
+            line()
+            line("1. Documentation agent: Generate TRD and milestone report")
+            line("2. Implementation agent: Build binary for STM32H562")
+            line("3. Program manager review: Schedule milestone delivery")
+        else:
+            line(f"**NO** - QuickTune has status: {status}")
+            line()
+            line("### Blockers")
+            line()
+            for req_id in failed_reqs:
+                line(f"- {req_id} must be resolved")
+            line()
+            line("### Next Steps")
+            line()
+            line("1. Implementation agent: Address failed requirements")
+            line("2. Validation agent: Re-run TRD validation")
+
+        line()
+        line("---")
+        line()
+        line("*Generated by Validation Agent*")
+        line(f"*{now_str}*")
 
     print(f"\nValidation report saved: {output_path}")
 
@@ -1263,25 +1611,39 @@ def generate_report(results: Dict, output_path: str):
 def main():
     """Main validation entry point."""
 
-    # Create output directory
+    parser = argparse.ArgumentParser(description='QuickTune TRD compliance validation campaign')
+    parser.add_argument('--no-plots', action='store_true',
+                        help='skip plot generation (e.g. for CI/regression runs)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='worker processes for rooms and plots (default: one per CPU)')
+    parser.add_argument('--bit-exact', action='store_true',
+                        help='measure through the sample-exact embedded tone/Goertzel path')
+    args = parser.parse_args()
+
     plot_dir = '/Users/jasonho610/Desktop/pg-dsp-studio-monitor/validation/quicktune/plots'
-    os.makedirs(plot_dir, exist_ok=True)
 
     # Create 10-room test suite
     rooms = create_10_room_test_suite()
 
     # Run TRD validation
-    results = validate_trd_requirements(rooms)
+    results = validate_trd_requirements(rooms, args.jobs, args.bit_exact)
 
     # Generate plots
-    print("\n" + "="*80)
-    print("GENERATING VALIDATION PLOTS")
-    print("="*80)
+    if not args.no_plots:
+        print("\n" + "="*80)
+        print("GENERATING VALIDATION PLOTS")
+        print("="*80)
+
+        os.makedirs(plot_dir, exist_ok=True)
 
-    for result in results['room_results']:
-        plot_room_results(result, plot_dir)
+        room_results = results['room_results']
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            filepaths = executor.map(plot_room_worker, room_results,
+                                     [plot_dir] * len(room_results))
+            for filepath in filepaths:
+                print(f"  Plot saved: {filepath}")
 
-    plot_summary(results, plot_dir)
+        plot_summary(results, plot_dir)
 
     # Generate report
     print("\n" + "="*80)
@@ -1297,7 +1659,7 @@ def main():
     print("="*80)
     print(f"\nOverall Status: {results['overall_status']}")
     print(f"Report: {report_path}")
-    print(f"Plots: {plot_dir}")
+    print(f"Plots: {'skipped (--no-plots)' if args.no_plots else plot_dir}")
     print("="*80)
 
 if __name__ == '__main__':